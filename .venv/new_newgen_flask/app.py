@@ -0,0 +1,611 @@
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, jsonify, stream_with_context
+from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from config import Config
+from models.database import db, login_manager
+from models.settings_cache import settings_cache
+from models.versioning import data_version
+from models.search import person_search
+from models.migrations import migrations
+from services.person_service import PersonService, API_FIELDS as PERSON_API_FIELDS, PUBLIC_API_FIELDS as PERSON_PUBLIC_FIELDS
+from services.team_service import TeamService, API_FIELDS as TEAM_API_FIELDS
+from services.theme_service import ThemeService
+from services.contact_service import ContactMessageService
+from services.import_service import ImportService, read_records, detect_format
+from services.summary_service import SummaryService
+from utils.auth import verify_password
+from utils.page_cache import page_cache
+from utils.metrics import request_metrics
+from utils.api import parse_fields, parse_limit, parse_int, ndjson_stream, csv_stream
+from models.entities import Person, Team, ContactMessage
+from models.database import User
+from datetime import datetime
+import click
+import io
+import os
+
+def create_app():
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    
+    # Initialize extensions
+    db.init_app(app)
+    login_manager.init_app(app)
+    settings_cache.init_app(app)
+    data_version.init_app(app)
+    page_cache.init_app(app)
+    request_metrics.init_app(app)
+    login_manager.login_view = 'login'
+    login_manager.login_message = 'Please log in to access this page.'
+    login_manager.login_message_category = 'warning'
+    
+    # Initialize services
+    person_service = PersonService()
+    team_service = TeamService()
+    theme_service = ThemeService()
+    contact_service = ContactMessageService()
+    summary_service = SummaryService()
+    import_service = ImportService()
+    
+    with app.app_context():
+        if app.config['MIGRATE_ON_BOOT']:
+            try:
+                migrations.upgrade()
+            except Exception as e:
+                # The failed revision stays pending and is retried on the next boot
+                print(f"Warning: migrations incomplete, run `flask migrate`: {e}")
+        elif not migrations.check():
+            print(f"Warning: database schema is behind revision {migrations.head()}; "
+                  "run `flask migrate`.")
+    
+    def load_theme_settings():
+        current_theme = theme_service.get_current_theme()
+        theme_class = "theme-light" if current_theme == "light" else "theme-dark"
+        
+        return {
+            'theme_mode': current_theme,
+            'theme_class': theme_class,
+            'app_name': 'NEC NewGen',
+            'college_name': 'National Engineering College',
+            'colors': Config.THEME_CONFIG.get(current_theme, Config.THEME_CONFIG['dark'])
+        }
+    
+    # Routes
+    @app.route('/')
+    def introduction():
+        return render_template('introduction.html')
+    
+    @app.route('/home')
+    @page_cache.cached
+    def home():
+        context = load_theme_settings()
+        context['total_members'] = person_service.count_active_persons()
+        context['teams'] = team_service.get_roster(include_members=False)
+        return render_template('home.html', **context)
+    
+    @app.route('/about')
+    @page_cache.cached
+    def about():
+        context = load_theme_settings()
+        return render_template('about.html', **context)
+    
+    @app.route('/services')
+    @page_cache.cached
+    def services():
+        context = load_theme_settings()
+        return render_template('services.html', **context)
+    
+    @app.route('/contact', methods=['GET', 'POST'])
+    def contact():
+        context = load_theme_settings()
+        
+        if request.method == 'POST':
+            name = request.form.get('name')
+            email = request.form.get('email')
+            message_text = request.form.get('message')
+            
+            if name and email and message_text:
+                message_data = {
+                    'name': name,
+                    'email': email,
+                    'message': message_text
+                }
+                try:
+                    contact_service.save_message(message_data)
+                    flash('Thank you for your message! We\'ll get back to you soon.', 'success')
+                    return redirect(url_for('contact'))
+                except Exception as e:
+                    flash('Error sending message. Please try again.', 'error')
+            else:
+                flash('Please fill in all fields.', 'error')
+        
+        return render_template('contact.html', **context)
+    
+    @app.route('/persons')
+    @page_cache.cached
+    def list_persons():
+        context = load_theme_settings()
+        context['persons'] = person_service.get_roster()
+        context['teams'] = team_service.get_roster()
+        context['total_members'] = person_service.count_active_persons()
+        context['total_teams'] = team_service.get_total_teams_count()
+        return render_template('team_members.html', **context)
+    
+    @app.route('/team-members')
+    @page_cache.cached
+    def team_members_combined():
+        """Combined view for teams and members"""
+        context = load_theme_settings()
+        context['persons'] = person_service.get_roster()
+        context['teams'] = team_service.get_roster()
+        context['total_members'] = person_service.count_active_persons()
+        context['total_teams'] = team_service.get_total_teams_count()
+        return render_template('team_members.html', **context)
+    
+    @app.route('/persons/add', methods=['GET', 'POST'])
+    @login_required
+    def add_person():
+        context = load_theme_settings()
+        
+        if request.method == 'POST':
+            # Get form data
+            first_name = request.form.get('firstName')
+            last_name = request.form.get('lastName')
+            email = request.form.get('email')
+            phone = request.form.get('phone')
+            role = request.form.get('role')
+            department = request.form.get('department')
+            join_date_str = request.form.get('joinDate')
+            status = request.form.get('status', 'Active')
+            team_id = request.form.get('team_id')
+            
+            # Validate required fields
+            if not all([first_name, last_name, email, role, department]):
+                flash('Please fill in all required fields.', 'error')
+                context['teams'] = team_service.get_all_teams()
+                return render_template('persons/add.html', **context)
+            
+            # Convert join_date if provided
+            join_date = None
+            if join_date_str:
+                try:
+                    join_date = datetime.strptime(join_date_str, '%Y-%m-%d').date()
+                except ValueError:
+                    join_date = datetime.utcnow().date()
+            
+            # Check if email already exists
+            if person_service.exists_by_email(email):
+                flash('A member with this email already exists!', 'error')
+                context['teams'] = team_service.get_all_teams()
+                return render_template('persons/add.html', **context)
+            
+            person_data = {
+                'first_name': first_name,
+                'last_name': last_name,
+                'email': email,
+                'phone': phone,
+                'role': role,
+                'department': department,
+                'join_date': join_date,
+                'status': status,
+                'team_id': team_id if team_id else None
+            }
+            
+            try:
+                person_service.save_person(person_data)
+                flash(f"Member {person_data['first_name']} {person_data['last_name']} added successfully!", 'success')
+                return redirect(url_for('list_persons'))
+            except Exception as e:
+                flash(f'Error adding member: {str(e)}', 'error')
+        
+        context['teams'] = team_service.get_all_teams()
+        return render_template('persons/add.html', **context)
+    
+    @app.route('/persons/edit/<int:person_id>', methods=['GET', 'POST'])
+    @login_required
+    def edit_person(person_id):
+        context = load_theme_settings()
+        person = person_service.get_person_by_id(person_id)
+        
+        if not person:
+            flash('Member not found!', 'error')
+            return redirect(url_for('list_persons'))
+        
+        if request.method == 'POST':
+            # Get form data
+            first_name = request.form.get('firstName')
+            last_name = request.form.get('lastName')
+            email = request.form.get('email')
+            phone = request.form.get('phone')
+            role = request.form.get('role')
+            department = request.form.get('department')
+            join_date_str = request.form.get('joinDate')
+            status = request.form.get('status')
+            team_id = request.form.get('team_id')
+            
+            # Validate required fields
+            if not all([first_name, last_name, email, role, department]):
+                flash('Please fill in all required fields.', 'error')
+                context['person'] = person
+                context['teams'] = team_service.get_all_teams()
+                return render_template('persons/edit.html', **context)
+            
+            # Convert join_date if provided
+            join_date = person.join_date
+            if join_date_str:
+                try:
+                    join_date = datetime.strptime(join_date_str, '%Y-%m-%d').date()
+                except ValueError:
+                    pass
+            
+            person_data = {
+                'first_name': first_name,
+                'last_name': last_name,
+                'email': email,
+                'phone': phone,
+                'role': role,
+                'department': department,
+                'join_date': join_date,
+                'status': status,
+                'team_id': team_id if team_id else None
+            }
+            
+            try:
+                person_service.update_person(person_id, person_data)
+                flash(f"Member {person_data['first_name']} {person_data['last_name']} updated successfully!", 'success')
+                return redirect(url_for('list_persons'))
+            except Exception as e:
+                flash(f'Error updating member: {str(e)}', 'error')
+        
+        context['person'] = person
+        context['teams'] = team_service.get_all_teams()
+        return render_template('persons/edit.html', **context)
+    
+    @app.route('/persons/delete/<int:person_id>')
+    @login_required
+    def delete_person(person_id):
+        person = person_service.get_person_by_id(person_id)
+        if person:
+            try:
+                person_service.delete_person(person_id)
+                flash(f"Member {person.first_name} {person.last_name} deleted successfully!", 'success')
+            except Exception as e:
+                flash(f'Error deleting member: {str(e)}', 'error')
+        else:
+            flash('Member not found!', 'error')
+        return redirect(url_for('list_persons'))
+    
+    @app.route('/persons/team/<int:team_id>')
+    @page_cache.cached
+    def view_team_members(team_id):
+        context = load_theme_settings()
+        team = team_service.get_team_with_members(team_id)
+        
+        if not team:
+            flash('Team not found!', 'error')
+            return redirect(url_for('list_persons'))
+        
+        context['team'] = team
+        context['members'] = [member for member in team.members if member.status == 'Active']
+        return render_template('persons/team_members.html', **context)
+    
+    @app.route('/teams')
+    def list_teams():
+        # Redirect to combined team members page
+        return redirect(url_for('team_members_combined'))
+    
+    @app.route('/teams/<int:team_id>')
+    @page_cache.cached
+    def view_team(team_id):
+        context = load_theme_settings()
+        team = team_service.get_team_with_members(team_id)
+        
+        if not team:
+            flash('Team not found!', 'error')
+            return redirect(url_for('list_teams'))
+        
+        context['team'] = team
+        return render_template('teams/view.html', **context)
+    
+    @app.route('/teams/add', methods=['GET', 'POST'])
+    @login_required
+    def add_team():
+        context = load_theme_settings()
+        
+        if request.method == 'POST':
+            name = request.form.get('name')
+            description = request.form.get('description')
+            icon = request.form.get('icon')
+            team_lead = request.form.get('teamLead')
+            
+            if not name:
+                flash('Team name is required!', 'error')
+                return render_template('teams/add.html', **context)
+            
+            if team_service.exists_by_name(name):
+                flash('A team with this name already exists!', 'error')
+                return render_template('teams/add.html', **context)
+            
+            team_data = {
+                'name': name,
+                'description': description,
+                'icon': icon,
+                'team_lead': team_lead
+            }
+            
+            try:
+                team_service.save_team(team_data)
+                flash(f"Team '{team_data['name']}' created successfully!", 'success')
+                return redirect(url_for('list_teams'))
+            except Exception as e:
+                flash(f'Error creating team: {str(e)}', 'error')
+        
+        return render_template('teams/add.html', **context)
+    
+    @app.route('/team')
+    def team_page():
+        context = load_theme_settings()
+        context['teams'] = team_service.get_all_teams_with_members()
+        return render_template('team.html', **context)
+    
+    @app.route('/settings', methods=['GET', 'POST'])
+    def settings():
+        context = load_theme_settings()
+        
+        if request.method == 'POST':
+            theme = request.form.get('theme')
+            if theme in ['dark', 'light']:
+                theme_service.save_theme(theme)
+                flash('Theme updated successfully!', 'success')
+                # Reload context with new theme
+                context = load_theme_settings()
+            else:
+                flash('Invalid theme selection!', 'error')
+        
+        return render_template('settings.html', **context)
+    
+    @app.route('/login', methods=['GET', 'POST'])
+    def login():
+        context = load_theme_settings()
+        
+        if current_user.is_authenticated:
+            return redirect(url_for('home'))
+        
+        if request.method == 'POST':
+            username = request.form.get('username')
+            password = request.form.get('password')
+            
+            user = verify_password(username, password)
+            if user:
+                login_user(user)
+                flash('Logged in successfully!', 'success')
+                next_page = request.args.get('next')
+                return redirect(next_page or url_for('home'))
+            else:
+                flash('Invalid username or password.', 'error')
+        
+        return render_template('login.html', **context)
+    
+    @app.route('/logout', methods=['POST'])
+    @login_required
+    def logout():
+        logout_user()
+        flash('You have been logged out successfully.', 'success')
+        return redirect(url_for('home'))
+    
+    # API Routes for AJAX
+    @app.route('/api/persons/count')
+    def api_persons_count():
+        return jsonify({'count': person_service.count_active_persons()})
+    
+    @app.route('/api/teams/count')
+    def api_teams_count():
+        return jsonify({'count': team_service.get_total_teams_count()})
+    
+    def person_api_filters():
+        filters = {
+            'team_id': parse_int(request.args.get('team_id'), 'team_id'),
+            'department': request.args.get('department') or None,
+            'status': 'Active'
+        }
+        # Only signed-in users may list inactive members; an empty status means any
+        if current_user.is_authenticated:
+            filters['status'] = request.args.get('status', 'Active') or None
+        return filters
+    
+    def person_api_fields():
+        # Anonymous callers get the public columns only, like the members pages
+        allowed = PERSON_API_FIELDS if current_user.is_authenticated else PERSON_PUBLIC_FIELDS
+        return parse_fields(request.args.get('fields'), allowed) or allowed
+    
+    @app.route('/api/persons')
+    def api_persons():
+        """Keyset-paginated persons: ?cursor=&limit=&fields=&team_id=&status=&department="""
+        try:
+            fields = person_api_fields()
+            cursor = parse_int(request.args.get('cursor'), 'cursor')
+            limit = parse_limit(request.args.get('limit'))
+            filters = person_api_filters()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        items, next_cursor = person_service.get_api_page(fields, cursor, limit, **filters)
+        return jsonify({'data': items, 'next_cursor': next_cursor, 'limit': limit})
+    
+    @app.route('/api/persons/search')
+    def api_persons_search():
+        """Ranked type-ahead search over active members: ?q=&limit=&offset="""
+        try:
+            limit = parse_limit(request.args.get('limit'), default=10, maximum=50)
+            offset = parse_int(request.args.get('offset'), 'offset') or 0
+            if offset < 0:
+                raise ValueError('offset must not be negative')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        persons = person_service.search_persons(request.args.get('q', ''), limit + 1, offset)
+        items = []
+        for person in persons[:limit]:
+            item = {
+                'id': person.id,
+                'full_name': person.full_name,
+                'role': person.role,
+                'department': person.department,
+                'team_id': person.team_id,
+                'team_name': person.team.name if person.team else None
+            }
+            # Contact details are for signed-in users only
+            if current_user.is_authenticated:
+                item['email'] = person.email
+            items.append(item)
+        return jsonify({'data': items, 'has_more': len(persons) > limit, 'limit': limit, 'offset': offset})
+    
+    @app.route('/api/teams')
+    def api_teams():
+        """Keyset-paginated teams: ?cursor=&limit=&fields="""
+        try:
+            fields = parse_fields(request.args.get('fields'), TEAM_API_FIELDS)
+            cursor = parse_int(request.args.get('cursor'), 'cursor')
+            limit = parse_limit(request.args.get('limit'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        items, next_cursor = team_service.get_api_page(fields, cursor, limit)
+        return jsonify({'data': items, 'next_cursor': next_cursor, 'limit': limit})
+    
+    @app.route('/api/persons/export')
+    @login_required
+    def api_persons_export():
+        """Stream every matching person as NDJSON (default) or CSV: ?format=csv"""
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in ('ndjson', 'csv'):
+            return jsonify({'error': 'format must be ndjson or csv'}), 400
+        try:
+            fields = parse_fields(request.args.get('fields'), PERSON_API_FIELDS) or PERSON_API_FIELDS
+            filters = person_api_filters()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        rows = person_service.iter_export(fields, **filters)
+        if export_format == 'csv':
+            body, mimetype = csv_stream(rows, fields), 'text/csv'
+        else:
+            body, mimetype = ndjson_stream(rows), 'application/x-ndjson'
+        response = Response(stream_with_context(body), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename=persons.{export_format}'
+        return response
+    
+    def upload_import(kind):
+        upload = request.files.get('file')
+        if not upload or not upload.filename:
+            return jsonify({'error': 'Upload a file in the "file" field.'}), 400
+        try:
+            file_format = request.form.get('format') or detect_format(upload.filename)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        records = read_records(stream, file_format)
+        if kind == 'teams':
+            report = import_service.import_teams(records)
+        else:
+            report = import_service.import_persons(records)
+        # An unreadable file that yielded nothing to import is the caller's error
+        status = 400 if report['file_error'] and not report['written'] else 200
+        return jsonify(report), status
+    
+    @app.route('/api/persons/import', methods=['POST'])
+    @login_required
+    def api_persons_import():
+        """Bulk upsert members from an uploaded CSV/JSON file; returns a per-row report."""
+        return upload_import('persons')
+    
+    @app.route('/api/teams/import', methods=['POST'])
+    @login_required
+    def api_teams_import():
+        """Bulk upsert teams from an uploaded CSV/JSON file; returns a per-row report."""
+        return upload_import('teams')
+    
+    @app.cli.command('bulk-import')
+    @click.argument('kind', type=click.Choice(['persons', 'teams']))
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--format', 'file_format', type=click.Choice(['csv', 'json']),
+                  help='Input format; inferred from the file extension by default.')
+    @click.option('--batch-size', default=1000, show_default=True)
+    def bulk_import(kind, path, file_format, batch_size):
+        """Upsert persons (on email) or teams (on name) from a CSV/JSON file."""
+        service = ImportService(batch_size=batch_size)
+        with open(path, encoding='utf-8-sig', newline='') as stream:
+            records = read_records(stream, file_format or detect_format(path))
+            if kind == 'teams':
+                report = service.import_teams(records)
+            else:
+                report = service.import_persons(records)
+        
+        if report['file_error']:
+            print(f"Stopped reading {path}: {report['file_error']}")
+        print(f"Processed {report['processed']} rows: {report['written']} written, "
+              f"{report['error_count']} rejected.")
+        for error in report['errors'][:20]:
+            print(f"  row {error['row']} ({error['key']}): {error['error']}")
+        if report['error_count'] > 20:
+            print(f"  ... {report['error_count'] - 20} more")
+    
+    @app.cli.command('migrate')
+    def migrate():
+        """Apply pending schema migrations and bootstrap data."""
+        applied = migrations.upgrade()
+        print(f"Applied {len(applied)} migrations; database is at {migrations.head()}.")
+    
+    @app.cli.command('migration-status')
+    def migration_status():
+        """List migrations and whether each has been applied."""
+        applied = migrations.applied()
+        for revision, description, _ in migrations.steps:
+            mark = 'x' if revision in applied else ' '
+            print(f"[{mark}] {revision}  {description}")
+    
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index():
+        """Create the member search index if needed and repopulate it."""
+        person_search.ensure()
+        person_search.rebuild()
+        print(f"Search index rebuilt ({person_search.backend()}).")
+    
+    @app.cli.command('verify-summary')
+    @click.option('--fix', is_flag=True, help='Rebuild the counters if any have drifted.')
+    def verify_summary(fix):
+        """Compare the denormalized member/team counters with real counts."""
+        mismatches = summary_service.verify()
+        if not mismatches:
+            print("Summary counters are consistent.")
+            return
+        for name, (stored, actual) in sorted(mismatches.items()):
+            print(f"  {name}: stored {stored}, actual {actual}")
+        if fix:
+            summary_service.rebuild()
+            print(f"Rebuilt counters ({len(mismatches)} were off).")
+        else:
+            print(f"{len(mismatches)} counters drifted; rerun with --fix to rebuild.")
+    
+    # Error handlers
+    @app.errorhandler(404)
+    def not_found_error(error):
+        context = load_theme_settings()
+        return render_template('404.html', **context), 404
+    
+    @app.errorhandler(500)
+    def internal_error(error):
+        db.session.rollback()
+        context = load_theme_settings()
+        return render_template('500.html', **context), 500
+    
+    @app.errorhandler(403)
+    def forbidden_error(error):
+        context = load_theme_settings()
+        return render_template('403.html', **context), 403
+    
+    return app
+
+if __name__ == '__main__':
+    app = create_app()
+    app.run(debug=True, host='127.0.0.1', port=8081)
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Shared helpers for the benchmark scripts: synthetic data and percentiles.
+
+Import models only inside functions; the scripts point DATABASE_URL at a
+scratch database before anything reads config.py.
+"""
+import math
+import random
+
+SYLLABLES = ['ar', 'un', 'ku', 'mar', 'sa', 'thi', 'ya', 'pri', 'dha', 'na', 'vi', 'sha',
+             'kan', 'ra', 'ja', 'de', 'va', 'moo', 'rthi', 'lak', 'shmi', 'ga', 'ne', 'sh']
+ROLES = ['Developer', 'Content Writer', 'Media Lead', 'Operations Coordinator',
+         'Research Coordinator', 'Volunteer', 'Technical Lead', 'Video Editor']
+DEPARTMENTS = ['IT', 'CSE', 'ECE', 'EEE', 'Mechanical', 'Civil', 'AI&DS']
+
+def make_name(rng):
+    return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).upper()
+
+def populate(persons, teams=20, seed=42, batch_size=5000):
+    """Insert ``teams`` teams and ``persons`` members (about 90% active).
+    
+    Rows go in through bulk Core inserts, so database triggers still fire
+    but ORM-side hooks don't; the summary counters are rebuilt at the end.
+    Returns the new team ids. The same seed
+    always produces the same data.
+    """
+    from models.database import db
+    from models.entities import Team, Person
+    from models.repositories import SummaryRepository
+    
+    rng = random.Random(seed)
+    team_rows = [
+        {'name': f'Bench Team {i}', 'description': 'Synthetic team', 'icon': 'fa-users',
+         'team_lead': make_name(rng)}
+        for i in range(teams)
+    ]
+    db.session.execute(Team.__table__.insert(), team_rows)
+    team_ids = [team_id for (team_id,) in db.session.query(Team.id).filter(Team.name.like('Bench Team %'))]
+    
+    batch = []
+    for i in range(persons):
+        batch.append({
+            'first_name': make_name(rng),
+            'last_name': make_name(rng),
+            'email': f'bench{i}@nec.edu.in',
+            'phone': f'9{rng.randint(100000000, 999999999)}',
+            'role': rng.choice(ROLES),
+            'department': rng.choice(DEPARTMENTS),
+            'status': 'Active' if rng.random() < 0.9 else 'Inactive',
+            'team_id': rng.choice(team_ids)
+        })
+        if len(batch) == batch_size:
+            db.session.execute(Person.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Person.__table__.insert(), batch)
+    db.session.commit()
+    SummaryRepository.rebuild()
+    return team_ids
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""
+Drive every route through the Flask test client at several data scales,
+as an anonymous visitor and as the signed-in admin, and report latency
+percentiles, throughput and queries per request as JSON, so runs can be
+diffed between commits.
+
+Usage:
+    python benchmarks/route_benchmark.py [--scales 1000,10000,100000]
+        [--requests 50] [--concurrency 4] [--page-cache] [--output FILE]
+
+Each scale runs in a fresh process against its own throwaway SQLite file
+(or an empty database given as BENCH_DATABASE_URL, which is wiped between
+scales by recreating the tables). One warm-up request per route is excluded
+from the figures. The rendered-page cache is off by default, so every
+request measures a full render; ``--page-cache`` measures cache hits instead.
+Admin routes (``admin_*``) render the signed-in sections of the templates,
+where per-row lazy loads would show up.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+
+from common import percentile, populate
+
+def build_routes(team_ids):
+    """(name, method, path, form data, as admin) for every route under test."""
+    team_id = team_ids[0]
+    contact = {'name': 'Bench User', 'email': 'bench@nec.edu.in', 'message': 'Benchmark message'}
+    public = [
+        ('home', 'GET', '/home', None),
+        ('about', 'GET', '/about', None),
+        ('services', 'GET', '/services', None),
+        ('settings', 'GET', '/settings', None),
+        ('team_members', 'GET', '/team-members', None),
+        ('persons', 'GET', '/persons', None),
+        ('team_persons', 'GET', f'/persons/team/{team_id}', None),
+        ('team_view', 'GET', f'/teams/{team_id}', None),
+        ('login', 'GET', '/login', None),
+        ('contact_post', 'POST', '/contact', contact),
+        ('api_persons_count', 'GET', '/api/persons/count', None),
+        ('api_teams_count', 'GET', '/api/teams/count', None),
+        ('api_persons', 'GET', '/api/persons?limit=50', None),
+        ('api_persons_team', 'GET', f'/api/persons?limit=50&team_id={team_id}', None),
+        ('api_teams', 'GET', '/api/teams', None),
+        ('api_persons_search', 'GET', '/api/persons/search?q=kumar', None),
+    ]
+    admin = [
+        ('admin_home', 'GET', '/home', None),
+        ('admin_team_members', 'GET', '/team-members', None),
+        ('admin_persons', 'GET', '/persons', None),
+        ('admin_team_persons', 'GET', f'/persons/team/{team_id}', None),
+        ('admin_team_view', 'GET', f'/teams/{team_id}', None),
+        ('admin_api_persons', 'GET', '/api/persons?limit=50', None),
+        ('admin_api_persons_export', 'GET', '/api/persons/export', None),
+    ]
+    return ([route + (False,) for route in public]
+            + [route + (True,) for route in admin])
+
+def measure_route(app, counter, method, path, data, admin_id, requests, concurrency):
+    def one_request(_):
+        # A fresh client per request: anonymous, or carrying only the admin's session
+        client = app.test_client(use_cookies=admin_id is not None)
+        if admin_id is not None:
+            with client.session_transaction() as session:
+                session['_user_id'] = str(admin_id)
+                session['_fresh'] = True
+        counter.value = 0
+        start = time.perf_counter()
+        response = client.open(path, method=method, data=data)
+        # Streamed responses (the export) only do their work while being read
+        response.get_data()
+        elapsed = time.perf_counter() - start
+        response.close()
+        return elapsed, counter.value, response.status_code
+    
+    one_request(None)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(one_request, range(requests)))
+    wall = time.perf_counter() - start
+    
+    latencies = sorted(elapsed * 1000 for elapsed, _, _ in samples)
+    statuses = {}
+    for _, _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    return {
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'max_ms': round(latencies[-1], 3),
+        'throughput_rps': round(requests / wall, 2),
+        'queries_per_request': round(sum(queries for _, queries, _ in samples) / requests, 2),
+        'status_codes': statuses
+    }
+
+def run_scale(scale, args):
+    """Build the app for one scale and benchmark every route; runs in a child process."""
+    tmpdir = tempfile.mkdtemp(prefix='nec-bench-')
+    os.environ['DATABASE_URL'] = (
+        os.environ.get('BENCH_DATABASE_URL') or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    )
+    os.environ['SETTINGS_VERSION_FILE'] = os.path.join(tmpdir, 'settings.version')
+    os.environ['DATA_VERSION_FILE'] = os.path.join(tmpdir, 'data.version')
+    os.environ['PAGE_CACHE_ENABLED'] = '1' if args.page_cache else '0'
+    os.environ['METRICS_ENABLED'] = '0'
+    
+    from sqlalchemy import event
+    from app import create_app
+    from models.database import db, User
+    
+    # Boot chatter would corrupt the JSON on stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        if 'BENCH_DATABASE_URL' in os.environ:
+            reset_app = create_app()
+            with reset_app.app_context():
+                db.drop_all()
+        app = create_app()
+    
+    counter = threading.local()
+    try:
+        with app.app_context():
+            start = time.perf_counter()
+            team_ids = populate(scale, teams=args.teams)
+            load_seconds = time.perf_counter() - start
+            admin_id = User.query.filter_by(username='admin').one().id
+            
+            def count_query(*_):
+                counter.value = getattr(counter, 'value', 0) + 1
+            event.listen(db.engine, 'before_cursor_execute', count_query)
+            dialect = db.engine.dialect.name
+        
+        routes = {}
+        for name, method, path, data, as_admin in build_routes(team_ids):
+            print(f'  scale {scale}: {name}', file=sys.stderr)
+            routes[name] = measure_route(app, counter, method, path, data,
+                                         admin_id if as_admin else None,
+                                         args.requests, args.concurrency)
+        return {'database': dialect, 'load_seconds': round(load_seconds, 2), 'routes': routes}
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--scales', default='1000,10000,100000',
+                        help='Comma-separated person counts (default: %(default)s)')
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=50, help='Measured requests per route')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--page-cache', action='store_true',
+                        help='Enable the rendered-page cache (measures cache hits, not renders)')
+    parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+    parser.add_argument('--worker-scale', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.worker_scale is not None:
+        print(json.dumps(run_scale(args.worker_scale, args)))
+        return
+    
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'requests_per_route': args.requests,
+            'concurrency': args.concurrency,
+            'teams': args.teams,
+            'page_cache': args.page_cache
+        },
+        'scales': {}
+    }
+    for scale in [int(value) for value in args.scales.split(',') if value.strip()]:
+        command = [sys.executable, os.path.abspath(__file__), '--worker-scale', str(scale),
+                   '--teams', str(args.teams), '--requests', str(args.requests),
+                   '--concurrency', str(args.concurrency)]
+        if args.page_cache:
+            command.append('--page-cache')
+        result = subprocess.run(command, cwd=ROOT, stdout=subprocess.PIPE, check=True, text=True)
+        report['scales'][str(scale)] = json.loads(result.stdout)
+    
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            fh.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
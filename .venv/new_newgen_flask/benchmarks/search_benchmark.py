@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Compare the indexed member search with the old leading-wildcard ILIKE query
+on a synthetic persons table. Prints one JSON document with per-query
+timings so results can be diffed between runs.
+
+The two don't return the same rows, so every query also reports match
+counts. The old query matched substrings of first name, last name and
+email for members of any status. The indexed search covers active
+members only, adds role, department and team name, and matches by
+backend:
+
+- pg_trgm and the ILIKE fallback match substrings.
+- SQLite FTS5 matches word prefixes, so "kumar" finds "Kumar" but not
+  "Sakumar".
+
+``legacy_active_missed`` counts active members the old query found and
+the indexed search doesn't.
+
+Usage:
+    python benchmarks/search_benchmark.py [--rows 100000] [--repeat 20]
+
+Uses a throwaway SQLite file unless BENCH_DATABASE_URL is set (point it at
+an empty PostgreSQL database to benchmark pg_trgm).
+"""
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from common import percentile, populate
+
+QUERIES = ['kumar', 'sath', 'lead', 'priya dev', 'media', 'zzzz']
+
+MATCH_SEMANTICS = {'fts5': 'word prefix', 'pg_trgm': 'substring', 'like': 'substring'}
+
+def timed(fn, repeat):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(percentile(samples, 95), 3),
+        'rows': len(result)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+    
+    tmpdir = tempfile.mkdtemp(prefix='nec-bench-')
+    os.environ['DATABASE_URL'] = (
+        os.environ.get('BENCH_DATABASE_URL') or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    )
+    # Keep cache version files away from the app's real instance folder
+    os.environ['SETTINGS_VERSION_FILE'] = os.path.join(tmpdir, 'settings.version')
+    os.environ['DATA_VERSION_FILE'] = os.path.join(tmpdir, 'data.version')
+    
+    from sqlalchemy import or_
+    from app import create_app
+    from models.database import db
+    from models.entities import Person
+    from models.search import person_search
+    
+    # Keep stdout for the JSON report; boot messages go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        app = create_app()
+    with app.app_context():
+        start = time.perf_counter()
+        populate(args.rows)
+        load_seconds = time.perf_counter() - start
+        
+        def legacy_query(keyword):
+            # The pre-index PersonRepository.search_persons() query
+            return Person.query.filter(or_(
+                Person.first_name.ilike(f'%{keyword}%'),
+                Person.last_name.ilike(f'%{keyword}%'),
+                Person.email.ilike(f'%{keyword}%')
+            ))
+        
+        results = {}
+        for keyword in QUERIES:
+            legacy_ids = {person.id for person in legacy_query(keyword)}
+            legacy_active_ids = {
+                person.id for person in legacy_query(keyword).filter(Person.status == 'Active')
+            }
+            indexed_ids = set(person_search.search_ids(keyword, limit=args.rows))
+            results[keyword] = {
+                'legacy_ilike': timed(lambda: legacy_query(keyword).all(), args.repeat),
+                'indexed': timed(lambda: person_search.search_ids(keyword, limit=args.limit), args.repeat),
+                'matches': {
+                    'legacy': len(legacy_ids),
+                    'legacy_active': len(legacy_active_ids),
+                    'indexed': len(indexed_ids),
+                    'overlap': len(legacy_active_ids & indexed_ids),
+                    'legacy_active_missed': len(legacy_active_ids - indexed_ids)
+                }
+            }
+        
+        print(json.dumps({
+            'database': db.engine.dialect.name,
+            'backend': person_search.backend(),
+            'match_semantics': MATCH_SEMANTICS[person_search.backend()],
+            'rows': args.rows,
+            'repeat': args.repeat,
+            'limit': args.limit,
+            'load_seconds': round(load_seconds, 2),
+            'queries': results
+        }, indent=2))
+    
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+from .database import db, login_manager, User
+from .entities import ThemeSettings, Team, Person, ContactMessage, StatCounter
+from .settings_cache import settings_cache
+from .versioning import data_version
+from .migrations import migrations
+
+__all__ = [
+    'db', 
+    'login_manager', 
+    'ThemeSettings', 
+    'Team', 
+    'Person', 
+    'ContactMessage',
+    'StatCounter',
+    'User',
+    'settings_cache',
+    'data_version',
+    'migrations'
+]
\ No newline at end of file
@@ -0,0 +1,141 @@
+from .database import db
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlite3 import Connection as SQLite3Connection
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, SQLite3Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+class ThemeSettings(db.Model):
+    __tablename__ = 'theme_settings'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    setting_key = db.Column(db.String(100), unique=True, nullable=False, index=True)
+    setting_value = db.Column(db.String(100), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ThemeSettings {self.setting_key}: {self.setting_value}>'
+
+class Team(db.Model):
+    __tablename__ = 'teams'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False, index=True)
+    description = db.Column(db.Text)
+    icon = db.Column(db.String(10))
+    team_lead = db.Column(db.String(100))
+    # Denormalized count of active members, maintained by the repositories
+    member_count = db.Column('active_member_count', db.Integer, nullable=False, default=0, server_default='0')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationship
+    members = db.relationship('Person', backref='team', lazy=True, cascade='all, delete-orphan')
+    
+    def __repr__(self):
+        return f'<Team {self.name}>'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'icon': self.icon,
+            'team_lead': self.team_lead,
+            'member_count': self.member_count,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class Person(db.Model):
+    __tablename__ = 'persons'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    first_name = db.Column(db.String(100), nullable=False, index=True)
+    last_name = db.Column(db.String(100), nullable=False, index=True)
+    email = db.Column(db.String(120), unique=True, nullable=False, index=True)
+    phone = db.Column(db.String(20))
+    role = db.Column(db.String(100))
+    department = db.Column(db.String(100))
+    join_date = db.Column(db.Date)
+    # active_history: the member counters need the old value even when it
+    # is overwritten without being loaded first (see SummaryRepository)
+    status = db.column_property(
+        db.Column(db.String(20), default='Active', index=True), active_history=True
+    )
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Foreign Key
+    team_id = db.column_property(
+        db.Column(db.Integer, db.ForeignKey('teams.id', ondelete='SET NULL'), index=True),
+        active_history=True
+    )
+    
+    @property
+    def full_name(self):
+        return f"{self.first_name} {self.last_name}"
+    
+    def __repr__(self):
+        return f'<Person {self.first_name} {self.last_name}>'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'full_name': self.full_name,
+            'email': self.email,
+            'phone': self.phone,
+            'role': self.role,
+            'department': self.department,
+            'join_date': self.join_date.isoformat() if self.join_date else None,
+            'status': self.status,
+            'team_id': self.team_id,
+            'team_name': self.team.name if self.team else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class StatCounter(db.Model):
+    __tablename__ = 'stat_counters'
+    
+    # Global totals kept in step with writes, e.g. 'persons.active', 'teams.total'
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<StatCounter {self.name}: {self.value}>'
+
+class ContactMessage(db.Model):
+    __tablename__ = 'contact_messages'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False, index=True)
+    email = db.Column(db.String(120), nullable=False, index=True)
+    message = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    is_read = db.Column(db.Boolean, default=False, index=True)
+    ip_address = db.Column(db.String(45))
+    user_agent = db.Column(db.Text)
+    
+    def __repr__(self):
+        return f'<ContactMessage {self.name}>'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email,
+            'message': self.message,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'is_read': self.is_read,
+            'ip_address': self.ip_address
+        }
\ No newline at end of file
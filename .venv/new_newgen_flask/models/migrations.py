@@ -0,0 +1,177 @@
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from sqlalchemy import inspect, select, text
+from .database import db
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Key for pg_advisory_lock; any constant shared by every process of this app
+UPGRADE_LOCK_KEY = zlib.crc32(b'nec_newgen.schema_migrations')
+
+class SchemaMigration(db.Model):
+    __tablename__ = 'schema_migrations'
+    
+    # Zero-padded so the latest revision also sorts last
+    revision = db.Column(db.String(20), primary_key=True)
+    description = db.Column(db.String(200))
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<SchemaMigration {self.revision}>'
+    
+class Migrations:
+    """Ordered schema and bootstrap-data steps, applied once per database.
+    
+    Each step runs at most once: ``upgrade()`` applies the pending ones in
+    order and records each revision in ``schema_migrations`` right after it
+    succeeds. ``check()`` is a single primary-key lookup, cheap enough for
+    every worker boot. ``upgrade()`` holds a cross-process lock, so workers
+    booting together apply each step once and the rest just see it done.
+    Steps must be idempotent, because one that fails part way is re-run
+    from the start next time, and the baseline already creates tables in
+    their current shape on a fresh database.
+    """
+    
+    def __init__(self):
+        self.steps = []
+    
+    def register(self, revision, description):
+        def decorator(func):
+            if self.steps and revision <= self.steps[-1][0]:
+                raise ValueError(f'Migration {revision} is out of order')
+            self.steps.append((revision, description, func))
+            return func
+        return decorator
+    
+    def head(self):
+        return self.steps[-1][0] if self.steps else None
+    
+    def applied(self):
+        """Applied revisions; empty when the tracking table doesn't exist yet."""
+        try:
+            return set(db.session.scalars(select(SchemaMigration.revision)))
+        except Exception:
+            db.session.rollback()
+            return set()
+    
+    def pending(self):
+        applied = self.applied()
+        return [step for step in self.steps if step[0] not in applied]
+    
+    def check(self):
+        """True when the latest revision this code knows about has been applied."""
+        try:
+            return db.session.get(SchemaMigration, self.head()) is not None
+        except Exception:
+            db.session.rollback()
+            return False
+        finally:
+            # Don't hold a pooled connection open in the master process
+            db.session.remove()
+    
+    def upgrade(self, echo=print):
+        """Apply pending steps in order; returns the revisions applied."""
+        # End any open transaction so reads below see other processes' commits
+        db.session.remove()
+        done = []
+        with _upgrade_lock():
+            SchemaMigration.__table__.create(db.engine, checkfirst=True)
+            # Read under the lock: another process may have just applied them
+            for revision, description, func in self.pending():
+                echo(f"Applying {revision}: {description}")
+                try:
+                    func()
+                    db.session.add(SchemaMigration(revision=revision, description=description))
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+                done.append(revision)
+        return done
+
+migrations = Migrations()
+
+@contextmanager
+def _upgrade_lock():
+    """Serialize upgrades across processes.
+    
+    PostgreSQL uses a session advisory lock on its own connection. SQLite
+    uses an OS lock on a file next to the database: holding ``BEGIN
+    IMMEDIATE`` would also block the migration's own writes, which go
+    through ``db.session`` on other connections.
+    """
+    engine = db.engine
+    database = engine.url.database
+    if engine.dialect.name == 'postgresql':
+        with engine.connect() as connection:
+            connection.execute(text('SELECT pg_advisory_lock(:key)'), {'key': UPGRADE_LOCK_KEY})
+            connection.commit()
+            try:
+                yield
+            finally:
+                connection.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': UPGRADE_LOCK_KEY})
+                connection.commit()
+    elif engine.dialect.name == 'sqlite' and database and database != ':memory:':
+        # Closing the file releases the lock
+        with open(f'{database}.migrate-lock', 'a') as handle:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            yield
+    else:
+        yield
+
+def _add_column(table, column, ddl):
+    """``ALTER TABLE ... ADD COLUMN`` unless the column exists (works on SQLite too)."""
+    existing = {col['name'] for col in inspect(db.session.connection()).get_columns(table)}
+    if column not in existing:
+        db.session.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+
+@migrations.register('0001', 'Create tables')
+def _create_tables():
+    # Only creates tables that are missing; existing ones are left alone
+    db.create_all()
+
+@migrations.register('0002', 'Backfill columns added after the first release')
+def _legacy_columns():
+    # Formerly run_alters.py / update_schema.py
+    timestamp = 'TIMESTAMP WITH TIME ZONE'
+    if db.engine.dialect.name == 'postgresql':
+        # Room for modern password hashes
+        db.session.execute(text('ALTER TABLE users ALTER COLUMN password TYPE VARCHAR(512)'))
+        timestamp += ' DEFAULT now()'
+    for table in ('theme_settings', 'teams', 'persons', 'contact_messages'):
+        _add_column(table, 'created_at', timestamp)
+    for table in ('theme_settings', 'teams', 'persons'):
+        _add_column(table, 'updated_at', timestamp)
+    _add_column('users', 'created_at', timestamp)
+    _add_column('users', 'last_login', 'TIMESTAMP WITH TIME ZONE')
+    _add_column('teams', 'active_member_count', 'INTEGER NOT NULL DEFAULT 0')
+
+@migrations.register('0003', 'Default theme and admin user')
+def _bootstrap_data():
+    from .repositories import ThemeSettingsRepository
+    from utils.auth import init_admin_user
+
+    if not ThemeSettingsRepository.get_by_key('theme.mode'):
+        ThemeSettingsRepository.save_or_update('theme.mode', 'dark')
+    init_admin_user()
+
+@migrations.register('0004', 'Member search index')
+def _search_index():
+    from .search import person_search
+
+    # Raise rather than fall back, so the revision is retried next upgrade
+    person_search.ensure(strict=True)
+
+@migrations.register('0005', 'Summary counters')
+def _summary_counters():
+    from .repositories import SummaryRepository
+
+    SummaryRepository.rebuild()
\ No newline at end of file
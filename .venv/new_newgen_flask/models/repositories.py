@@ -0,0 +1,429 @@
+from .entities import ThemeSettings, Team, Person, ContactMessage, StatCounter
+from .database import db
+from .settings_cache import settings_cache
+from .search import person_search
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+def _upsert(model, rows, conflict_column, update_columns):
+    """Batched INSERT ... ON CONFLICT DO UPDATE in one transaction; returns the row count.
+    
+    Runs as a single executemany of one cached statement; psycopg2 sends it
+    as multi-row VALUES pages, SQLite loops in C.
+    """
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f'Bulk upsert is not supported on {dialect}')
+    if not rows:
+        return 0
+    stmt = insert(model.__table__)
+    set_ = {column: stmt.excluded[column] for column in update_columns or []}
+    set_['updated_at'] = datetime.utcnow()
+    stmt = stmt.on_conflict_do_update(index_elements=[conflict_column], set_=set_)
+    try:
+        db.session.execute(stmt, rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(rows)
+
+class ThemeSettingsRepository:
+    @staticmethod
+    def get_by_key(key):
+        return ThemeSettings.query.filter_by(setting_key=key).first()
+    
+    @staticmethod
+    def get_value(key, default=None):
+        """Cached lookup; costs no query while the settings cache is fresh."""
+        return settings_cache.get(key, default)
+    
+    @staticmethod
+    def save_or_update(key, value):
+        setting = ThemeSettings.query.filter_by(setting_key=key).first()
+        if setting:
+            setting.setting_value = value
+        else:
+            setting = ThemeSettings(setting_key=key, setting_value=value)
+            db.session.add(setting)
+        db.session.commit()
+        settings_cache.bump()
+        return setting
+
+class TeamRepository:
+    @staticmethod
+    def get_all():
+        return Team.query.order_by(Team.name).all()
+    
+    @staticmethod
+    def get_by_id(team_id):
+        return Team.query.get(team_id)
+    
+    @staticmethod
+    def get_by_name(name):
+        return Team.query.filter_by(name=name).first()
+    
+    @staticmethod
+    def get_with_members(team_id):
+        return TeamRepository._roster_query().filter(Team.id == team_id).first()
+    
+    @staticmethod
+    def get_all_with_members():
+        return TeamRepository.get_roster()
+    
+    @staticmethod
+    def get_roster(include_members=True):
+        """Teams (with their stored member counts) and optionally active members.
+        
+        Runs one query for the teams and, when members are included, one
+        select-in query for all of their active members, however many rows
+        there are. ``team.members`` only holds active members on the result.
+        """
+        return TeamRepository._roster_query(include_members).order_by(Team.id).all()
+    
+    @staticmethod
+    def _roster_query(include_members=True):
+        query = Team.query
+        if include_members:
+            query = query.options(
+                selectinload(Team.members.and_(Person.status == 'Active'))
+            )
+        return query
+    
+    @staticmethod
+    def save(team):
+        db.session.add(team)
+        db.session.commit()
+        return team
+    
+    @staticmethod
+    def delete(team_id):
+        team = Team.query.get(team_id)
+        if team:
+            db.session.delete(team)
+            db.session.commit()
+        return team
+    
+    @staticmethod
+    def get_page(after_id=None, limit=50):
+        """Keyset page ordered by id; fetches ``limit + 1`` rows to detect a next page."""
+        query = Team.query
+        if after_id is not None:
+            query = query.filter(Team.id > after_id)
+        return query.order_by(Team.id).limit(limit + 1).all()
+    
+    @staticmethod
+    def get_name_map():
+        """Lower-cased team name to id, for resolving names in bulk."""
+        return {name.lower(): team_id for team_id, name in db.session.query(Team.id, Team.name)}
+    
+    @staticmethod
+    def upsert_many(rows, update_columns=None):
+        return _upsert(Team, rows, 'name', update_columns)
+    
+    @staticmethod
+    def exists_by_name(name):
+        return Team.query.filter_by(name=name).first() is not None
+    
+    @staticmethod
+    def count_total():
+        return SummaryRepository.get('teams.total')
+
+class PersonRepository:
+    # Columns the JSON API and export may select, keyed by field name
+    API_FIELDS = {
+        'id': Person.id,
+        'first_name': Person.first_name,
+        'last_name': Person.last_name,
+        'email': Person.email,
+        'phone': Person.phone,
+        'role': Person.role,
+        'department': Person.department,
+        'join_date': Person.join_date,
+        'status': Person.status,
+        'team_id': Person.team_id,
+        'team_name': Team.name,
+        'created_at': Person.created_at,
+        'updated_at': Person.updated_at
+    }
+    
+    @staticmethod
+    def get_all():
+        return Person.query.filter_by(status='Active').all()
+    
+    @staticmethod
+    def get_roster():
+        """Active persons with their team joined in, in a single query."""
+        return (
+            Person.query.options(joinedload(Person.team))
+            .filter_by(status='Active')
+            .order_by(Person.id)
+            .all()
+        )
+    
+    @staticmethod
+    def get_by_id(person_id):
+        return Person.query.get(person_id)
+    
+    @staticmethod
+    def get_by_email(email):
+        return Person.query.filter_by(email=email).first()
+    
+    @staticmethod
+    def get_by_team_id(team_id):
+        return Person.query.filter_by(team_id=team_id, status='Active').order_by(Person.first_name).all()
+    
+    @staticmethod
+    def get_active_members():
+        return Person.query.filter_by(status='Active').all()
+    
+    @staticmethod
+    def count_active_members():
+        return SummaryRepository.get('persons.active')
+    
+    @staticmethod
+    def save(person):
+        db.session.add(person)
+        db.session.commit()
+        return person
+    
+    @staticmethod
+    def soft_delete(person_id):
+        person = Person.query.get(person_id)
+        if person:
+            person.status = 'Inactive'
+            db.session.commit()
+        return person
+    
+    @staticmethod
+    def upsert_many(rows, update_columns=None):
+        return _upsert(Person, rows, 'email', update_columns)
+    
+    @staticmethod
+    def exists_by_email(email):
+        return Person.query.filter_by(email=email).first() is not None
+    
+    @staticmethod
+    def get_page(fields, after_id=None, limit=50, **filters):
+        """Keyset page of plain rows ordered by id.
+        
+        Selects only ``fields`` (plus ``id`` for the cursor) and joins the team
+        name in SQL rather than per row. Fetches ``limit + 1`` rows so the
+        caller can tell whether there is a next page.
+        """
+        query = PersonRepository._api_query(fields, **filters)
+        if after_id is not None:
+            query = query.filter(Person.id > after_id)
+        return query.order_by(Person.id).limit(limit + 1).all()
+    
+    @staticmethod
+    def iter_rows(fields, batch_size=1000, **filters):
+        """Iterate every matching row in id order in batches of ``batch_size``.
+        
+        Uses ``yield_per``, which streams from a server-side cursor on
+        PostgreSQL, so memory stays flat however many rows match.
+        """
+        query = PersonRepository._api_query(fields, **filters)
+        return query.order_by(Person.id).yield_per(batch_size)
+    
+    @staticmethod
+    def _api_query(fields, team_id=None, status=None, department=None):
+        names = ['id'] + [name for name in fields if name != 'id']
+        query = db.session.query(
+            *[PersonRepository.API_FIELDS[name].label(name) for name in names]
+        ).select_from(Person)
+        if 'team_name' in names:
+            query = query.outerjoin(Team, Person.team_id == Team.id)
+        if team_id is not None:
+            query = query.filter(Person.team_id == team_id)
+        if status:
+            query = query.filter(Person.status == status)
+        if department:
+            query = query.filter(Person.department == department)
+        return query
+    
+    @staticmethod
+    def search_persons(keyword, limit=20, offset=0, status='Active'):
+        """Ranked, indexed search; returns persons (with team loaded), best match first."""
+        ids = person_search.search_ids(keyword, limit=limit, offset=offset, status=status)
+        if not ids:
+            return []
+        persons = Person.query.options(joinedload(Person.team)).filter(Person.id.in_(ids)).all()
+        by_id = {person.id: person for person in persons}
+        return [by_id[person_id] for person_id in ids if person_id in by_id]
+
+class SummaryRepository:
+    """Denormalized counters: teams.active_member_count plus global totals.
+    
+    Every ORM flush adjusts them (see ``_maintain_summary``) with relative
+    ``UPDATE ... SET x = x + delta`` statements in the same transaction as
+    the change, so concurrent edits can't lose updates and saves, soft
+    deletes, team moves and cascaded team deletes are all covered. Core-level
+    bulk writes bypass the ORM and must call ``rebuild()`` afterwards.
+    """
+    
+    @staticmethod
+    def get(name):
+        counter = db.session.get(StatCounter, name)
+        return counter.value if counter else 0
+    
+    @staticmethod
+    def verify():
+        """Return ``{counter: (stored, actual)}`` for every counter that has drifted."""
+        mismatches = {}
+        actual_teams = dict(
+            db.session.query(Person.team_id, func.count(Person.id))
+            .filter(Person.status == 'Active', Person.team_id.isnot(None))
+            .group_by(Person.team_id)
+        )
+        for team_id, name, stored in db.session.query(Team.id, Team.name, Team.member_count):
+            actual = actual_teams.get(team_id, 0)
+            if stored != actual:
+                mismatches[f'team:{name}'] = (stored, actual)
+        for name, actual in SummaryRepository._actual_totals().items():
+            counter = db.session.get(StatCounter, name)
+            stored = counter.value if counter else None
+            if stored != actual:
+                mismatches[name] = (stored, actual)
+        return mismatches
+    
+    @staticmethod
+    def rebuild():
+        """Recompute every counter from the source tables in one transaction."""
+        active_count = (
+            select(func.count(Person.id))
+            .where(Person.team_id == Team.id, Person.status == 'Active')
+            .scalar_subquery()
+        )
+        db.session.execute(
+            update(Team).values(member_count=active_count)
+            .execution_options(synchronize_session=False)
+        )
+        for name, value in SummaryRepository._actual_totals().items():
+            counter = db.session.get(StatCounter, name)
+            if counter:
+                counter.value = value
+            else:
+                db.session.add(StatCounter(name=name, value=value))
+        db.session.commit()
+    
+    @staticmethod
+    def _actual_totals():
+        return {
+            'persons.active': Person.query.filter_by(status='Active').count(),
+            'teams.total': Team.query.count()
+        }
+
+@event.listens_for(Session, 'after_flush')
+def _maintain_summary(session, flush_context):
+    """Turn the flushed person/team changes into counter deltas.
+    
+    Runs after the flush so foreign keys set through relationships
+    (``Person(team=t)``, ``team.members.append(p)``) are filled in and
+    delete-orphan removals are known; history is still pre-flush here.
+    """
+    team_deltas = defaultdict(int)
+    total_deltas = defaultdict(int)
+    
+    def move(before, after):
+        (old_team, old_active), (new_team, new_active) = before, after
+        if old_active and old_team is not None:
+            team_deltas[old_team] -= 1
+        if new_active and new_team is not None:
+            team_deltas[new_team] += 1
+        total_deltas['persons.active'] += int(new_active) - int(old_active)
+    
+    for obj in session.new:
+        if isinstance(obj, Person):
+            move((None, False), _membership(obj, committed=False))
+        elif isinstance(obj, Team):
+            total_deltas['teams.total'] += 1
+    for obj in session.dirty:
+        if isinstance(obj, Person):
+            # A member removed from team.members is deleted as an orphan during
+            # the flush; only the flush context records that
+            orphaned = flush_context.states.get(inspect(obj), (False, False))[0]
+            after = (None, False) if orphaned else _membership(obj, committed=False)
+            move(_membership(obj, committed=True), after)
+    for obj in session.deleted:
+        if isinstance(obj, Person):
+            move(_membership(obj, committed=True), (None, False))
+        elif isinstance(obj, Team):
+            total_deltas['teams.total'] -= 1
+    
+    if not any(team_deltas.values()) and not any(total_deltas.values()):
+        return
+    connection = session.connection()
+    teams = Team.__table__
+    counters = StatCounter.__table__
+    # Fixed order, so concurrent transactions lock team rows the same way round
+    for team_id, delta in sorted(team_deltas.items()):
+        if delta:
+            connection.execute(
+                update(teams).where(teams.c.id == team_id)
+                .values(active_member_count=teams.c.active_member_count + delta)
+            )
+    for name, delta in sorted(total_deltas.items()):
+        if delta:
+            connection.execute(
+                update(counters).where(counters.c.name == name)
+                .values(value=counters.c.value + delta)
+            )
+
+def _membership(person, committed):
+    """``(team_id, is_active)`` as last loaded from the database, or as pending."""
+    state = inspect(person)
+    values = []
+    for attr in ('team_id', 'status'):
+        history = state.attrs[attr].history
+        if committed and history.added:
+            # Changed: the old value (loaded thanks to active_history; none means NULL)
+            value = history.deleted[0] if history.deleted else None
+        else:
+            value = getattr(person, attr)
+        values.append(value)
+    return _team_key(values[0]), values[1] == 'Active'
+
+def _team_key(team_id):
+    return int(team_id) if team_id not in (None, '') else None
+
+class ContactMessageRepository:
+    @staticmethod
+    def get_all():
+        return ContactMessage.query.order_by(ContactMessage.created_at.desc()).all()
+    
+    @staticmethod
+    def get_unread():
+        return ContactMessage.query.filter_by(is_read=False).order_by(ContactMessage.created_at.desc()).all()
+    
+    @staticmethod
+    def count_unread():
+        return ContactMessage.query.filter_by(is_read=False).count()
+    
+    @staticmethod
+    def save(message):
+        db.session.add(message)
+        db.session.commit()
+        return message
+    
+    @staticmethod
+    def mark_as_read(message_id):
+        message = ContactMessage.query.get(message_id)
+        if message:
+            message.is_read = True
+            db.session.commit()
+        return message
+    
+    @staticmethod
+    def delete(message_id):
+        message = ContactMessage.query.get(message_id)
+        if message:
+            db.session.delete(message)
+            db.session.commit()
+        return message
@@ -0,0 +1,184 @@
+import re
+from sqlalchemy import case, or_, text
+from .database import db
+from .entities import Person, Team
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Must match the indexed expression exactly for PostgreSQL to use the index
+PG_SEARCH_EXPR = (
+    "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+    "coalesce(email, '') || ' ' || coalesce(role, '') || ' ' || coalesce(department, ''))"
+)
+
+POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS ix_persons_search_trgm ON persons USING gin (({PG_SEARCH_EXPR}) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_teams_name_trgm ON teams USING gin (lower(name) gin_trgm_ops)",
+]
+
+FTS_COLUMNS = 'first_name, last_name, email, role, department, team_name'
+FTS_VALUES = (
+    "new.id, new.first_name, new.last_name, new.email, new.role, new.department, "
+    "(SELECT name FROM teams WHERE id = new.team_id)"
+)
+
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS persons_fts USING fts5({FTS_COLUMNS}, prefix='2 3')",
+    f"""CREATE TRIGGER IF NOT EXISTS persons_fts_ai AFTER INSERT ON persons BEGIN
+        INSERT INTO persons_fts(rowid, {FTS_COLUMNS}) VALUES ({FTS_VALUES});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS persons_fts_au
+        AFTER UPDATE OF first_name, last_name, email, role, department, team_id ON persons BEGIN
+        DELETE FROM persons_fts WHERE rowid = old.id;
+        INSERT INTO persons_fts(rowid, {FTS_COLUMNS}) VALUES ({FTS_VALUES});
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS persons_fts_ad AFTER DELETE ON persons BEGIN
+        DELETE FROM persons_fts WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS teams_fts_au AFTER UPDATE OF name ON teams BEGIN
+        UPDATE persons_fts SET team_name = new.name
+        WHERE rowid IN (SELECT id FROM persons WHERE team_id = new.id);
+    END""",
+]
+
+SQLITE_REBUILD = [
+    "DELETE FROM persons_fts",
+    f"""INSERT INTO persons_fts(rowid, {FTS_COLUMNS})
+        SELECT p.id, p.first_name, p.last_name, p.email, p.role, p.department, t.name
+        FROM persons p LEFT JOIN teams t ON t.id = p.team_id""",
+]
+
+class PersonSearchIndex:
+    """Ranked person search over name, email, role, department and team name.
+    
+    PostgreSQL uses pg_trgm GIN indexes (substring match, ranked by word
+    similarity). SQLite uses an FTS5 table kept in sync by triggers (word
+    prefix match, ranked by bm25). Anything else, or a database where the
+    index couldn't be created, falls back to ILIKE scans.
+    """
+    
+    def __init__(self):
+        self._backend = None
+    
+    def ensure(self, strict=False):
+        """Create the index objects if missing; safe to run repeatedly.
+        
+        Failures fall back to ILIKE with a warning, or re-raise when ``strict``
+        so a migration isn't recorded as applied.
+        """
+        dialect = db.engine.dialect.name
+        try:
+            if dialect == 'postgresql':
+                for stmt in POSTGRES_DDL:
+                    db.session.execute(text(stmt))
+            elif dialect == 'sqlite':
+                created = not self._has_sqlite_table()
+                for stmt in SQLITE_DDL:
+                    db.session.execute(text(stmt))
+                if created:
+                    for stmt in SQLITE_REBUILD:
+                        db.session.execute(text(stmt))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            self._backend = None
+            if strict:
+                raise
+            print(f"Warning: search index unavailable, falling back to ILIKE: {e}")
+        self._backend = None
+    
+    def rebuild(self):
+        """Repopulate the SQLite FTS table from persons; PostgreSQL needs no rebuild."""
+        if self.backend() == 'fts5':
+            for stmt in SQLITE_REBUILD:
+                db.session.execute(text(stmt))
+            db.session.commit()
+    
+    def backend(self):
+        if self._backend is None or self._backend[0] is not db.engine:
+            self._backend = (db.engine, self._detect_backend())
+        return self._backend[1]
+    
+    def search_ids(self, keyword, limit=20, offset=0, status='Active'):
+        """Ids of matching persons, best match first. Every word must match."""
+        tokens = TOKEN_RE.findall((keyword or '').lower())
+        if not tokens:
+            return []
+        backend = self.backend()
+        if backend == 'fts5':
+            return self._search_fts5(tokens, limit, offset, status)
+        if backend == 'pg_trgm':
+            return self._search_trgm(keyword, tokens, limit, offset, status)
+        return self._search_like(tokens, limit, offset, status)
+    
+    def _detect_backend(self):
+        dialect = db.engine.dialect.name
+        if dialect == 'sqlite' and self._has_sqlite_table():
+            return 'fts5'
+        if dialect == 'postgresql' and db.session.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).first():
+            return 'pg_trgm'
+        return 'like'
+    
+    def _has_sqlite_table(self):
+        return db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'persons_fts'")
+        ).first() is not None
+    
+    def _search_fts5(self, tokens, limit, offset, status):
+        # Each word becomes a quoted prefix term; terms are ANDed
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        sql = (
+            "SELECT persons.id FROM persons_fts JOIN persons ON persons.id = persons_fts.rowid "
+            "WHERE persons_fts MATCH :match"
+            + (" AND persons.status = :status" if status else "")
+            + " ORDER BY bm25(persons_fts, 10.0, 10.0, 5.0, 2.0, 1.0, 1.0), persons.id"
+            " LIMIT :limit OFFSET :offset"
+        )
+        params = {'match': match, 'status': status, 'limit': limit, 'offset': offset}
+        return [row[0] for row in db.session.execute(text(sql), params)]
+    
+    def _search_trgm(self, keyword, tokens, limit, offset, status):
+        # Per word: persons whose text matches UNION persons of matching teams,
+        # each an index scan (an OR with a team subquery can't use the GIN
+        # index and scans persons). Words are then INTERSECTed.
+        params = {'q': keyword.lower(), 'status': status, 'limit': limit, 'offset': offset}
+        per_token = []
+        for i, token in enumerate(tokens):
+            params[f't{i}'] = f'%{_escape_like(token)}%'
+            per_token.append(
+                f"(SELECT id FROM persons WHERE {PG_SEARCH_EXPR} LIKE :t{i} "
+                f"UNION SELECT persons.id FROM persons JOIN teams ON teams.id = persons.team_id "
+                f"WHERE lower(teams.name) LIKE :t{i})"
+            )
+        sql = (
+            f"SELECT persons.id FROM persons JOIN ({' INTERSECT '.join(per_token)}) AS matches "
+            "ON matches.id = persons.id"
+            + (" WHERE persons.status = :status" if status else "")
+            + f" ORDER BY word_similarity(:q, {PG_SEARCH_EXPR}) DESC, persons.id "
+            "LIMIT :limit OFFSET :offset"
+        )
+        return [row[0] for row in db.session.execute(text(sql), params)]
+    
+    def _search_like(self, tokens, limit, offset, status):
+        query = db.session.query(Person.id).outerjoin(Team, Person.team_id == Team.id)
+        for token in tokens:
+            pattern = f'%{_escape_like(token)}%'
+            query = query.filter(or_(
+                *[column.ilike(pattern, escape='\\') for column in (
+                    Person.first_name, Person.last_name, Person.email,
+                    Person.role, Person.department, Team.name
+                )]
+            ))
+        if status:
+            query = query.filter(Person.status == status)
+        first_word = case((Person.first_name.ilike(f'{_escape_like(tokens[0])}%', escape='\\'), 0), else_=1)
+        query = query.order_by(first_word, Person.id).limit(limit).offset(offset)
+        return [row.id for row in query]
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+person_search = PersonSearchIndex()
@@ -0,0 +1,57 @@
+import threading
+import time
+from .entities import ThemeSettings
+from .versioning import VersionFile
+
+class SettingsCache:
+    """Per-worker cache of the theme_settings table.
+    
+    Every setting is loaded in one query and served from memory until
+    ``SETTINGS_CACHE_TTL`` seconds pass or the shared version file changes.
+    Writers call ``bump()`` after committing, which replaces the version
+    file; other workers on the host notice it with a single ``stat()`` on
+    their next read. The TTL bounds staleness where the file isn't shared
+    (e.g. workers on another host). A TTL of 0 disables caching.
+    """
+    
+    def __init__(self, app=None):
+        self.ttl = 30
+        self.version = VersionFile('settings.version', 'SETTINGS_VERSION_FILE')
+        self._lock = threading.Lock()
+        self._snapshot = None
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.ttl = app.config.get('SETTINGS_CACHE_TTL', 30)
+        self.version.init_app(app)
+        self.invalidate()
+    
+    def get(self, key, default=None):
+        return self._values().get(key, default)
+    
+    def invalidate(self):
+        self._snapshot = None
+    
+    def bump(self):
+        """Drop the local snapshot and signal other workers to drop theirs."""
+        self.invalidate()
+        self.version.bump()
+    
+    def _values(self):
+        snapshot = self._snapshot
+        if snapshot is not None:
+            values, version, expires_at = snapshot
+            if time.monotonic() < expires_at and version == self.version.read():
+                return values
+        return self._reload()
+    
+    def _reload(self):
+        with self._lock:
+            # Read the version before the data so a concurrent bump is never missed
+            version = self.version.read()
+            values = {s.setting_key: s.setting_value for s in ThemeSettings.query.all()}
+            self._snapshot = (values, version, time.monotonic() + self.ttl)
+            return values
+
+settings_cache = SettingsCache()
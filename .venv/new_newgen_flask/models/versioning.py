@@ -0,0 +1,45 @@
+import os
+import uuid
+
+class VersionFile:
+    """A file whose identity changes on every bump, shared by local workers.
+    
+    Readers compare a ``stat()`` token instead of opening the file, so a
+    check costs one syscall. ``bump()`` writes a fresh file and atomically
+    renames it into place, which gives it a new inode and mtime.
+    """
+    
+    def __init__(self, filename, config_key):
+        self.filename = filename
+        self.config_key = config_key
+        self.path = None
+    
+    def init_app(self, app):
+        self.path = (
+            app.config.get(self.config_key)
+            or os.path.join(app.instance_path, self.filename)
+        )
+    
+    def read(self):
+        if not self.path:
+            return None
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def bump(self):
+        if not self.path:
+            return
+        tmp_path = f'{self.path}.{uuid.uuid4().hex}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(tmp_path, 'w') as fh:
+                fh.write(uuid.uuid4().hex)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: {self.filename} not bumped, other workers may serve stale data: {e}")
+
+# Bumped whenever teams, persons or the theme change; keys rendered-page caches
+data_version = VersionFile('data.version', 'DATA_VERSION_FILE')
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+"""
+Apply pending schema migrations without the Flask CLI.
+
+The ALTER statements that used to live here (and in update_schema.py) are
+now revision 0002 in models/migrations.py; `flask migrate` is the preferred
+entry point. Applied revisions are recorded, so running this twice is safe.
+
+Usage:
+    python run_alters.py
+
+"""
+import os
+
+# Create the app without migrating at boot, then migrate explicitly below
+os.environ['MIGRATE_ON_BOOT'] = '0'
+
+from app import create_app
+from models.migrations import migrations
+
+app = create_app()
+with app.app_context():
+    applied = migrations.upgrade()
+    print(f"Done. Applied {len(applied)} migrations; database is at {migrations.head()}.")
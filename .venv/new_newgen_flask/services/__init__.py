@@ -0,0 +1,6 @@
+from .person_service import PersonService
+from .team_service import TeamService
+from .theme_service import ThemeService
+from .contact_service import ContactMessageService
+from .import_service import ImportService
+from .summary_service import SummaryService
\ No newline at end of file
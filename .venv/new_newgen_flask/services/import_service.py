@@ -0,0 +1,216 @@
+import csv
+import itertools
+import json
+import re
+from datetime import datetime
+from models.repositories import PersonRepository, TeamRepository, SummaryRepository
+from models.versioning import data_version
+
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+$')
+PERSON_STATUSES = ('Active', 'Inactive', 'On Leave')
+PERSON_COLUMNS = (
+    'first_name', 'last_name', 'email', 'phone', 'role', 'department',
+    'join_date', 'status', 'team_id'
+)
+TEAM_COLUMNS = ('name', 'description', 'icon', 'team_lead')
+# Keep the report bounded on badly broken files; error_count still has the total
+MAX_REPORTED_ERRORS = 1000
+
+class ImportService:
+    """Bulk member/team import with validation and batched upserts.
+    
+    Records are consumed lazily and written ``batch_size`` at a time with one
+    batched ``INSERT ... ON CONFLICT DO UPDATE`` per transaction (on email
+    for persons, name for teams), so memory stays bounded and a bad row
+    never aborts the import: it lands in the returned report instead.
+    Columns a record leaves out are left untouched on existing rows; they
+    only take their defaults (e.g. status ``Active``) on insert.
+    """
+    
+    def __init__(self, batch_size=1000):
+        self.person_repository = PersonRepository()
+        self.team_repository = TeamRepository()
+        self.batch_size = batch_size
+    
+    def import_persons(self, records):
+        team_ids = self.team_repository.get_name_map()
+        known_ids = set(team_ids.values())
+        return self._run(
+            records,
+            lambda record: _clean_person(record, team_ids, known_ids),
+            'email',
+            self.person_repository.upsert_many
+        )
+    
+    def import_teams(self, records):
+        return self._run(records, _clean_team, 'name', self.team_repository.upsert_many)
+    
+    def _run(self, records, clean, key, write):
+        report = {'processed': 0, 'written': 0, 'error_count': 0, 'errors': [], 'file_error': None}
+        # Rows are grouped by the columns their record provided, so each upsert
+        # only overwrites what its records actually contained
+        groups = {}
+        group_of = {}
+        for number, record in enumerate(_guard_reader(records, report), 1):
+            report['processed'] += 1
+            try:
+                if isinstance(record, Exception):
+                    raise ValueError(str(record))
+                row, provided = clean(record)
+            except ValueError as e:
+                _add_error(report, number, record, str(e))
+                continue
+            update_columns = tuple(column for column in provided if column != key)
+            previous = group_of.get(row[key])
+            if previous is not None and previous != update_columns:
+                # Write the earlier record first so the later one still wins
+                self._flush_group(groups, group_of, previous, write, report)
+            batch = groups.setdefault(update_columns, {})
+            # Later duplicates within a batch win, matching what separate batches do
+            batch[row[key]] = (number, row)
+            group_of[row[key]] = update_columns
+            if len(batch) >= self.batch_size:
+                self._flush_group(groups, group_of, update_columns, write, report)
+        for update_columns in list(groups):
+            self._flush_group(groups, group_of, update_columns, write, report)
+        if report['written']:
+            # Upserts bypass the ORM flush hooks that keep the counters current
+            SummaryRepository.rebuild()
+            data_version.bump()
+        return report
+    
+    def _flush_group(self, groups, group_of, update_columns, write, report):
+        batch = groups.pop(update_columns)
+        for row_key in batch:
+            del group_of[row_key]
+        self._flush(batch, write, list(update_columns), report)
+    
+    def _flush(self, batch, write, update_columns, report):
+        entries = list(batch.values())
+        try:
+            report['written'] += write([row for _, row in entries], update_columns)
+            return
+        except Exception:
+            pass
+        # Retry row by row so the failure is pinned on the offending records
+        for number, row in entries:
+            try:
+                report['written'] += write([row], update_columns)
+            except Exception as e:
+                _add_error(report, number, row, str(getattr(e, 'orig', None) or e))
+
+def read_records(stream, file_format):
+    """Lazily yield dicts from a text stream of CSV, NDJSON or a JSON array.
+    
+    CSV headers are normalised (``First Name`` -> ``first_name``). An NDJSON
+    line that fails to parse is yielded as a ValueError so it shows up in
+    the report. A JSON array has to be parsed whole; use NDJSON for big files.
+    """
+    if file_format == 'csv':
+        reader = csv.DictReader(stream)
+        reader.fieldnames = [_normalize_key(key) for key in reader.fieldnames or []]
+        for row in reader:
+            row.pop(None, None)
+            yield row
+        return
+    
+    head = stream.read(1)
+    while head and head.isspace():
+        head = stream.read(1)
+    if head == '[':
+        yield from json.loads(head + stream.read())
+        return
+    for line in itertools.chain([head + stream.readline()], stream):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield ValueError(f'invalid JSON: {e}')
+
+def detect_format(filename):
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension == 'csv':
+        return 'csv'
+    if extension in ('json', 'ndjson', 'jsonl'):
+        return 'json'
+    raise ValueError('File must be .csv, .json, .ndjson or .jsonl')
+
+def _guard_reader(records, report):
+    """Stop at a file-level read error (bad JSON array, bad encoding) and report it."""
+    try:
+        yield from records
+    except (ValueError, csv.Error) as e:
+        # JSONDecodeError and UnicodeDecodeError are both ValueErrors
+        report['file_error'] = f'could not read file: {e}'
+
+def _clean_person(record, team_ids, known_ids):
+    if not isinstance(record, dict):
+        raise ValueError('record must be an object')
+    row = {column: None for column in PERSON_COLUMNS}
+    provided = [column for column in PERSON_COLUMNS if column in record]
+    for column in ('first_name', 'last_name', 'email'):
+        row[column] = _text(record.get(column))
+        if not row[column]:
+            raise ValueError(f'{column} is required')
+    if not EMAIL_RE.match(row['email']):
+        raise ValueError(f"invalid email '{row['email']}'")
+    for column in ('phone', 'role', 'department'):
+        row[column] = _text(record.get(column))
+    
+    join_date = _text(record.get('join_date'))
+    if join_date:
+        try:
+            row['join_date'] = datetime.strptime(join_date, '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError(f"invalid join_date '{join_date}', expected YYYY-MM-DD")
+    
+    row['status'] = _text(record.get('status'))
+    if row['status'] is None:
+        # A blank status (e.g. an empty CSV cell) only defaults new members to
+        # Active; existing members, soft-deleted ones included, keep theirs
+        row['status'] = 'Active'
+        if 'status' in provided:
+            provided.remove('status')
+    if row['status'] not in PERSON_STATUSES:
+        raise ValueError(f"invalid status '{row['status']}'")
+    
+    team_id = _text(record.get('team_id'))
+    team_name = _text(record.get('team'))
+    if team_id:
+        try:
+            row['team_id'] = int(team_id)
+        except ValueError:
+            raise ValueError(f"invalid team_id '{team_id}'")
+        if row['team_id'] not in known_ids:
+            raise ValueError(f'unknown team_id {team_id}')
+    elif team_name:
+        row['team_id'] = team_ids.get(team_name.lower())
+        if row['team_id'] is None:
+            raise ValueError(f"unknown team '{team_name}'")
+    if ('team' in record or 'team_id' in record) and 'team_id' not in provided:
+        provided.append('team_id')
+    return row, provided
+
+def _clean_team(record):
+    if not isinstance(record, dict):
+        raise ValueError('record must be an object')
+    row = {column: _text(record.get(column)) for column in TEAM_COLUMNS}
+    if not row['name']:
+        raise ValueError('name is required')
+    return row, [column for column in TEAM_COLUMNS if column in record]
+
+def _text(value):
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+def _normalize_key(key):
+    return key.strip().lower().replace(' ', '_')
+
+def _add_error(report, number, record, message):
+    report['error_count'] += 1
+    if len(report['errors']) < MAX_REPORTED_ERRORS:
+        key = (record.get('email') or record.get('name')) if isinstance(record, dict) else None
+        report['errors'].append({'row': number, 'key': key, 'error': message})
@@ -0,0 +1,76 @@
+from models.repositories import PersonRepository
+from models.entities import Person
+from models.versioning import data_version
+from datetime import date
+
+API_FIELDS = list(PersonRepository.API_FIELDS)
+# What anonymous visitors may see; contact details are for signed-in users only
+PUBLIC_API_FIELDS = ['id', 'first_name', 'last_name', 'role', 'department', 'team_id', 'team_name']
+
+class PersonService:
+    def __init__(self):
+        self.repository = PersonRepository()
+    
+    def get_all_persons(self):
+        return self.repository.get_all()
+    
+    def get_roster(self):
+        return self.repository.get_roster()
+    
+    def get_person_by_id(self, person_id):
+        return self.repository.get_by_id(person_id)
+    
+    def save_person(self, person_data):
+        person = Person(**person_data)
+        person = self.repository.save(person)
+        data_version.bump()
+        return person
+    
+    def update_person(self, person_id, person_data):
+        person = self.repository.get_by_id(person_id)
+        if person:
+            for key, value in person_data.items():
+                setattr(person, key, value)
+            person = self.repository.save(person)
+            data_version.bump()
+            return person
+        return None
+    
+    def delete_person(self, person_id):
+        person = self.repository.soft_delete(person_id)
+        if person:
+            data_version.bump()
+        return person
+    
+    def exists_by_email(self, email):
+        return self.repository.exists_by_email(email)
+    
+    def count_active_persons(self):
+        return self.repository.count_active_members()
+    
+    def get_persons_by_team_id(self, team_id):
+        return self.repository.get_by_team_id(team_id)
+    
+    def search_persons(self, keyword, limit=20, offset=0):
+        return self.repository.search_persons(keyword, limit=limit, offset=offset)
+    
+    def get_api_page(self, fields=None, cursor=None, limit=50, **filters):
+        """Return ``(items, next_cursor)``; ``next_cursor`` is None on the last page."""
+        fields = fields or API_FIELDS
+        rows = self.repository.get_page(fields, after_id=cursor, limit=limit, **filters)
+        next_cursor = rows[limit - 1].id if len(rows) > limit else None
+        return [_serialize_row(row, fields) for row in rows[:limit]], next_cursor
+    
+    def iter_export(self, fields=None, **filters):
+        """Yield one serialized dict per matching person, streamed from the database."""
+        fields = fields or API_FIELDS
+        for row in self.repository.iter_rows(fields, **filters):
+            yield _serialize_row(row, fields)
+
+def _serialize_row(row, fields):
+    values = row._mapping
+    item = {}
+    for name in fields:
+        value = values[name]
+        item[name] = value.isoformat() if isinstance(value, date) else value
+    return item
\ No newline at end of file
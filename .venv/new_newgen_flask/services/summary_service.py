@@ -0,0 +1,14 @@
+from models.repositories import SummaryRepository
+from models.versioning import data_version
+
+class SummaryService:
+    def __init__(self):
+        self.repository = SummaryRepository()
+    
+    def verify(self):
+        return self.repository.verify()
+    
+    def rebuild(self):
+        self.repository.rebuild()
+        # Cached pages show the counts; drop them everywhere
+        data_version.bump()
\ No newline at end of file
@@ -0,0 +1,55 @@
+from models.repositories import TeamRepository
+from models.entities import Team
+from models.versioning import data_version
+
+API_FIELDS = [
+    'id', 'name', 'description', 'icon', 'team_lead', 'member_count',
+    'created_at', 'updated_at'
+]
+
+class TeamService:
+    def __init__(self):
+        self.repository = TeamRepository()
+    
+    def get_all_teams(self):
+        return self.repository.get_all()
+    
+    def get_team_by_id(self, team_id):
+        return self.repository.get_by_id(team_id)
+    
+    def get_team_with_members(self, team_id):
+        return self.repository.get_with_members(team_id)
+    
+    def get_all_teams_with_members(self):
+        return self.repository.get_all_with_members()
+    
+    def get_roster(self, include_members=True):
+        return self.repository.get_roster(include_members)
+    
+    def save_team(self, team_data):
+        team = Team(**team_data)
+        team = self.repository.save(team)
+        data_version.bump()
+        return team
+    
+    def delete_team(self, team_id):
+        team = self.repository.delete(team_id)
+        if team:
+            data_version.bump()
+        return team
+    
+    def exists_by_name(self, name):
+        return self.repository.exists_by_name(name)
+    
+    def get_total_teams_count(self):
+        return self.repository.count_total()
+    
+    def get_api_page(self, fields=None, cursor=None, limit=50):
+        """Return ``(items, next_cursor)``; ``next_cursor`` is None on the last page."""
+        teams = self.repository.get_page(after_id=cursor, limit=limit)
+        next_cursor = teams[limit - 1].id if len(teams) > limit else None
+        items = []
+        for team in teams[:limit]:
+            data = team.to_dict()
+            items.append({name: data[name] for name in fields} if fields else data)
+        return items, next_cursor
\ No newline at end of file
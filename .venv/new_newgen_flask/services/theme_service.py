@@ -0,0 +1,18 @@
+from models.repositories import ThemeSettingsRepository
+from models.versioning import data_version
+
+class ThemeService:
+    def __init__(self):
+        self.repository = ThemeSettingsRepository()
+    
+    def get_current_theme(self):
+        return self.repository.get_value('theme.mode', 'dark')
+    
+    def save_theme(self, theme_mode):
+        setting = self.repository.save_or_update('theme.mode', theme_mode)
+        data_version.bump()
+        return setting
+    
+    def initialize_default_theme(self):
+        if not self.repository.get_by_key('theme.mode'):
+            self.repository.save_or_update('theme.mode', 'dark')
\ No newline at end of file
@@ -0,0 +1,58 @@
+import os
+import sys
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from config import Config
+from app import create_app
+from models.database import db, User
+from models.entities import Team, Person
+
+@pytest.fixture
+def app_config(tmp_path):
+    """Settings for a throwaway SQLite app; also usable as env vars for subprocesses."""
+    return {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'SETTINGS_VERSION_FILE': str(tmp_path / 'settings.version'),
+        'DATA_VERSION_FILE': str(tmp_path / 'data.version'),
+        'SETTINGS_CACHE_TTL': 3600,
+        'PAGE_CACHE_ENABLED': False,
+        'METRICS_ENABLED': False,
+        'MIGRATE_ON_BOOT': True
+    }
+
+@pytest.fixture
+def make_app(app_config, monkeypatch):
+    def factory(**overrides):
+        for key, value in {**app_config, **overrides}.items():
+            monkeypatch.setattr(Config, key, value)
+        return create_app()
+    return factory
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+def seed(teams, members_per_team):
+    """Add teams with active members, plus one inactive member per team."""
+    for i in range(teams):
+        team = Team(name=f'Team {i}', description='Test team', team_lead=f'Lead {i}')
+        db.session.add(team)
+        db.session.flush()
+        for j in range(members_per_team + 1):
+            db.session.add(Person(
+                first_name=f'First{i}x{j}', last_name='Last',
+                email=f'member{i}x{j}@nec.edu.in', role='Member',
+                department='CSE', team_id=team.id,
+                status='Active' if j < members_per_team else 'Inactive'
+            ))
+    db.session.commit()
+
+def login(client, username='admin'):
+    with client.application.app_context():
+        user_id = User.query.filter_by(username=username).one().id
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
@@ -0,0 +1,42 @@
+import io
+import pytest
+from models.database import db
+from models.entities import Person
+from services import ImportService, PersonService
+from services.import_service import read_records
+
+@pytest.fixture
+def ctx(app):
+    with app.app_context():
+        yield
+
+def import_persons(text, file_format):
+    return ImportService(batch_size=2).import_persons(read_records(io.StringIO(text), file_format))
+
+def stored(email):
+    db.session.expire_all()
+    return Person.query.filter_by(email=email).one()
+
+def test_blank_status_keeps_soft_deleted_member_inactive(ctx):
+    import_persons('first_name,last_name,email,status,phone\nA,B,a@nec.edu.in,,111\n', 'csv')
+    assert stored('a@nec.edu.in').status == 'Active'
+    PersonService().delete_person(stored('a@nec.edu.in').id)
+    
+    report = import_persons('first_name,last_name,email,status,phone\nA,B,a@nec.edu.in,,222\n', 'csv')
+    assert report['written'] == 1
+    member = stored('a@nec.edu.in')
+    assert (member.status, member.phone) == ('Inactive', '222')
+
+def test_omitted_columns_are_not_overwritten(ctx):
+    import_persons('{"first_name": "A", "last_name": "B", "email": "a@nec.edu.in", "phone": "111"}\n', 'json')
+    import_persons(
+        '{"first_name": "C", "last_name": "D", "email": "c@nec.edu.in", "phone": "222"}\n'
+        '{"first_name": "A", "last_name": "B", "email": "a@nec.edu.in"}\n',
+        'json'
+    )
+    assert stored('a@nec.edu.in').phone == '111'
+
+def test_unreadable_file_is_reported(ctx):
+    report = import_persons('[{"first_name": ', 'json')
+    assert report['written'] == 0
+    assert report['file_error'].startswith('could not read file')
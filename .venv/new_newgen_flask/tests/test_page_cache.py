@@ -0,0 +1,54 @@
+import pytest
+from utils.page_cache import page_cache
+from utils.query_counter import count_queries
+from conftest import seed, login
+from models.database import db
+from services.team_service import TeamService
+
+@pytest.fixture
+def cached_app(make_app):
+    app = make_app(PAGE_CACHE_ENABLED=True)
+    with app.app_context():
+        seed(teams=2, members_per_team=2)
+    return app
+
+def test_admin_markup_not_served_to_anonymous(cached_app):
+    anonymous = cached_app.test_client()
+    admin = cached_app.test_client()
+    login(admin)
+    
+    assert 'Team Members Directory' not in anonymous.get('/team-members').get_data(as_text=True)
+    assert 'Team Members Directory' in admin.get('/team-members').get_data(as_text=True)
+    # Both variants are cached now; neither may answer for the other
+    assert 'Team Members Directory' not in anonymous.get('/team-members').get_data(as_text=True)
+    assert 'Team Members Directory' in admin.get('/team-members').get_data(as_text=True)
+
+def test_matching_etag_gets_304_without_queries(cached_app):
+    client = cached_app.test_client()
+    with cached_app.app_context():
+        engine = db.engine
+    etag = client.get('/team-members').headers['ETag']
+    
+    with count_queries(engine) as counter:
+        response = client.get('/team-members', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert counter.count == 0
+
+def test_write_invalidates_cached_page(cached_app):
+    client = cached_app.test_client()
+    first = client.get('/team-members')
+    assert 'Team Cached' not in first.get_data(as_text=True)
+    
+    with cached_app.app_context():
+        TeamService().save_team({'name': 'Team Cached', 'description': 'New', 'team_lead': 'Lead'})
+    
+    second = client.get('/team-members', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert 'Team Cached' in second.get_data(as_text=True)
+
+def test_unread_query_arguments_share_one_entry(cached_app):
+    client = cached_app.test_client()
+    for i in range(5):
+        assert client.get(f'/team-members?x={i}').status_code == 200
+    assert len(page_cache._entries) == 1
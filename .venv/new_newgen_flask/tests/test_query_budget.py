@@ -0,0 +1,50 @@
+import pytest
+from utils.query_counter import assert_max_queries
+from conftest import seed, login
+from models.database import db
+
+# (anonymous, admin) per page, however many teams and members there are;
+# the admin adds one query to load the signed-in user
+QUERY_BUDGET = {
+    '/home': (3, 4),
+    '/team-members': (5, 6),
+    '/persons': (5, 6)
+}
+
+def measure(app, path, admin):
+    client = app.test_client()
+    if admin:
+        login(client)
+    with app.app_context():
+        engine = db.engine
+    # Requests run outside any outer app context, so each gets a fresh session
+    # and nothing loaded by an earlier request can hide a lazy load
+    client.get(path)  # warms the per-worker settings cache
+    with assert_max_queries(QUERY_BUDGET[path][admin], engine) as counter:
+        response = client.get(path)
+    assert response.status_code == 200
+    return counter.count
+
+@pytest.mark.parametrize('admin', [False, True], ids=['anonymous', 'admin'])
+@pytest.mark.parametrize('path', sorted(QUERY_BUDGET))
+def test_roster_pages_run_constant_queries(make_app, path, admin):
+    small = make_app()
+    with small.app_context():
+        seed(teams=2, members_per_team=3)
+    small_count = measure(small, path, admin)
+    
+    large = make_app(SQLALCHEMY_DATABASE_URI=small.config['SQLALCHEMY_DATABASE_URI'] + '.large')
+    with large.app_context():
+        seed(teams=12, members_per_team=25)
+    large_count = measure(large, path, admin)
+    
+    assert small_count == large_count
+
+def test_admin_sections_render(app):
+    # Guards the measurement itself: the admin-only markup must be in the page
+    with app.app_context():
+        seed(teams=2, members_per_team=2)
+    client = app.test_client()
+    login(client)
+    body = client.get('/team-members').get_data(as_text=True)
+    assert 'Team Members Directory' in body
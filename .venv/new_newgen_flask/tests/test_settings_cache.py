@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+from models.repositories import ThemeSettingsRepository
+from utils.query_counter import count_queries
+from conftest import PROJECT_ROOT
+
+WRITE_SETTING = '''
+from app import create_app
+from models.repositories import ThemeSettingsRepository
+app = create_app()
+with app.app_context():
+    ThemeSettingsRepository.save_or_update('theme.mode', 'light')
+'''
+
+def run_other_worker(app_config, code):
+    """Run ``code`` in a separate process against the same database and version file."""
+    env = dict(os.environ)
+    env.update({
+        'DATABASE_URL': app_config['SQLALCHEMY_DATABASE_URI'],
+        'SETTINGS_VERSION_FILE': app_config['SETTINGS_VERSION_FILE'],
+        'DATA_VERSION_FILE': app_config['DATA_VERSION_FILE'],
+        'SETTINGS_CACHE_TTL': str(app_config['SETTINGS_CACHE_TTL']),
+        'MIGRATE_ON_BOOT': '0'
+    })
+    subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, env=env, check=True)
+
+def test_steady_state_reads_run_no_queries(app):
+    with app.app_context():
+        ThemeSettingsRepository.get_value('theme.mode')
+        with count_queries() as counter:
+            for _ in range(50):
+                assert ThemeSettingsRepository.get_value('theme.mode') == 'dark'
+    assert counter.count == 0
+
+def test_write_in_another_process_is_seen(app, app_config):
+    with app.app_context():
+        assert ThemeSettingsRepository.get_value('theme.mode') == 'dark'
+    
+    # The TTL is an hour, so only the shared version file can explain a reload
+    run_other_worker(app_config, WRITE_SETTING)
+    
+    with app.app_context():
+        with count_queries() as counter:
+            assert ThemeSettingsRepository.get_value('theme.mode') == 'light'
+            assert ThemeSettingsRepository.get_value('theme.mode') == 'light'
+    assert counter.count == 1
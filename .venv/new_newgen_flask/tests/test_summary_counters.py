@@ -0,0 +1,104 @@
+import pytest
+from models.database import db
+from models.entities import Person, Team
+from models.repositories import SummaryRepository, TeamRepository
+from services import PersonService, TeamService
+
+@pytest.fixture
+def ctx(app):
+    with app.app_context():
+        yield
+
+@pytest.fixture
+def teams(ctx):
+    a = Team(name='Alpha')
+    b = Team(name='Beta')
+    db.session.add_all([a, b])
+    db.session.commit()
+    return a, b
+
+def person(email, **fields):
+    return Person(first_name='Test', last_name='Member', email=email, **fields)
+
+def assert_consistent():
+    db.session.expire_all()
+    assert SummaryRepository.verify() == {}
+
+def test_add_edit_and_soft_delete(teams):
+    a, b = teams
+    service = PersonService()
+    member = service.save_person({
+        'first_name': 'Test', 'last_name': 'Member', 'email': 'one@nec.edu.in', 'team_id': a.id
+    })
+    assert_consistent()
+    assert db.session.get(Team, a.id).member_count == 1
+    
+    service.update_person(member.id, {'team_id': b.id})
+    assert_consistent()
+    assert db.session.get(Team, b.id).member_count == 1
+    
+    service.delete_person(member.id)
+    assert_consistent()
+    assert SummaryRepository.get('persons.active') == 0
+    
+    service.update_person(member.id, {'status': 'Active'})
+    assert_consistent()
+
+def test_relationship_assignment(teams):
+    a, b = teams
+    db.session.add(person('rel@nec.edu.in', team=a))
+    db.session.commit()
+    assert_consistent()
+    
+    c = Team(name='Gamma')
+    c.members.append(person('append@nec.edu.in'))
+    db.session.add(c)
+    db.session.commit()
+    assert_consistent()
+    assert db.session.get(Team, c.id).member_count == 1
+    
+    moved = Person.query.filter_by(email='rel@nec.edu.in').one()
+    moved.team = b
+    db.session.commit()
+    assert_consistent()
+    
+    moved.team = None
+    db.session.commit()
+    assert_consistent()
+
+def test_reassign_without_loading_old_value(teams):
+    a, b = teams
+    db.session.add(person('expired@nec.edu.in', team_id=a.id))
+    db.session.commit()
+    # Attributes are expired after commit; the old team_id was never read
+    member = Person.query.filter_by(email='expired@nec.edu.in').one()
+    db.session.commit()
+    member.team_id = b.id
+    db.session.commit()
+    assert_consistent()
+
+def test_orphan_removal_and_team_delete(teams):
+    a, _ = teams
+    db.session.add_all([person('m1@nec.edu.in', team=a), person('m2@nec.edu.in', team=a)])
+    db.session.commit()
+    
+    team = db.session.get(Team, a.id)
+    team.members.remove(team.members[0])
+    db.session.commit()
+    assert_consistent()
+    assert db.session.get(Team, a.id).member_count == 1
+    
+    TeamService().delete_team(a.id)
+    assert_consistent()
+    assert SummaryRepository.get('teams.total') == 1
+    assert SummaryRepository.get('persons.active') == 0
+
+def test_verify_reports_drift(teams):
+    a, _ = teams
+    db.session.add(person('drift@nec.edu.in', team=a))
+    db.session.commit()
+    db.session.execute(db.update(Team).values(member_count=9).execution_options(synchronize_session=False))
+    db.session.commit()
+    assert SummaryRepository.verify() == {'team:Alpha': (9, 1), 'team:Beta': (9, 0)}
+    SummaryRepository.rebuild()
+    assert_consistent()
@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+"""
+Kept for existing deploy scripts; same as `flask migrate` and run_alters.py.
+Run with the virtualenv active:
+
+    python update_schema.py
+
+Schema changes are versioned migrations in models/migrations.py.
+"""
+import runpy
+import os
+
+if __name__ == '__main__':
+    runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'run_alters.py'))
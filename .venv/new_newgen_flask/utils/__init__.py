@@ -0,0 +1,4 @@
+from .auth import init_admin_user, verify_password
+from .query_counter import count_queries, assert_max_queries
+from .page_cache import page_cache
+from .metrics import request_metrics
\ No newline at end of file
@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# Rows are buffered into chunks of roughly this many characters before being sent
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def parse_fields(raw, allowed):
+    """Parse a comma-separated ``fields`` argument; None means all fields."""
+    if not raw:
+        return None
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+def parse_limit(raw, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    if raw is None:
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ValueError('limit must be an integer')
+    if not 1 <= limit <= maximum:
+        raise ValueError(f'limit must be between 1 and {maximum}')
+    return limit
+
+def parse_int(raw, name):
+    if raw is None or raw == '':
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+
+def ndjson_stream(items):
+    """Encode dicts as newline-delimited JSON, yielding buffered chunks."""
+    buffer = []
+    size = 0
+    for item in items:
+        line = json.dumps(item, default=str) + '\n'
+        buffer.append(line)
+        size += len(line)
+        if size >= STREAM_CHUNK_SIZE:
+            yield ''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
+
+def csv_stream(items, fields):
+    """Encode dicts as CSV with a header row, yielding buffered chunks."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction='ignore')
+    writer.writeheader()
+    for item in items:
+        writer.writerow(item)
+        if buffer.tell() >= STREAM_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
@@ -0,0 +1,189 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from flask import Response, abort, g, has_request_context, request, template_rendered, before_render_template
+from sqlalchemy import event
+from models.database import db
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+class Histogram:
+    """Prometheus-style histogram keyed by a label tuple."""
+    
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series = {}
+    
+    def observe(self, labels, value):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+    
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            base = _format_labels(self.label_names, labels)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += bucket_count
+                le = _format_labels(self.label_names + ('le',), labels + (str(bound),))
+                lines.append(f'{self.name}_bucket{le} {cumulative}')
+            lines.append(f'{self.name}_sum{base} {total}')
+            lines.append(f'{self.name}_count{base} {count}')
+        return lines
+
+class Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = {}
+    
+    def inc(self, labels):
+        self._values[labels] = self._values.get(labels, 0) + 1
+    
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        for labels, value in sorted(self._values.items()):
+            lines.append(f'{self.name}{_format_labels(self.label_names, labels)} {value}')
+        return lines
+
+class RequestMetrics:
+    """Opt-in per-request instrumentation exported at ``/metrics``.
+    
+    With ``METRICS_ENABLED`` off nothing is registered, so the disabled cost
+    is zero. When on, each request records latency, SQL statement count and
+    time (engine cursor events), Jinja render time and response size into
+    in-process histograms labelled by endpoint. Requests slower than
+    ``METRICS_SLOW_REQUEST_MS`` are logged with their slowest statements.
+    Figures are per worker process; scrape every worker or aggregate upstream.
+    """
+    
+    def __init__(self, app=None):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._create_metrics()
+        if app is not None:
+            self.init_app(app)
+    
+    def _create_metrics(self):
+        labels = ('endpoint', 'method')
+        self.requests = Counter('newgen_requests_total', 'Requests handled.', labels + ('status',))
+        self.latency = Histogram('newgen_request_duration_seconds',
+                                 'Time spent handling the request.', labels, LATENCY_BUCKETS)
+        self.sql_queries = Histogram('newgen_request_sql_queries',
+                                     'SQL statements executed per request.', labels, QUERY_COUNT_BUCKETS)
+        self.sql_time = Histogram('newgen_request_sql_duration_seconds',
+                                  'Time spent executing SQL per request.', labels, LATENCY_BUCKETS)
+        self.render_time = Histogram('newgen_request_render_duration_seconds',
+                                     'Time spent rendering Jinja templates per request.', labels, LATENCY_BUCKETS)
+        self.response_size = Histogram('newgen_response_size_bytes',
+                                       'Response body size, when known up front.', labels, SIZE_BUCKETS)
+    
+    def init_app(self, app):
+        self.enabled = app.config.get('METRICS_ENABLED', False)
+        if not self.enabled:
+            return
+        self.slow_request_ms = app.config.get('METRICS_SLOW_REQUEST_MS', 0)
+        self.slow_query_count = app.config.get('METRICS_SLOW_QUERY_COUNT', 5)
+        self.token = app.config.get('METRICS_TOKEN')
+        self.logger = app.logger
+        
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        before_render_template.connect(self._before_render, app, weak=False)
+        template_rendered.connect(self._after_render, app, weak=False)
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(db.engine, 'after_cursor_execute', self._after_cursor_execute)
+        app.add_url_rule('/metrics', 'metrics', self.metrics_view)
+    
+    def metrics_view(self):
+        if self.token and request.headers.get('Authorization') != f'Bearer {self.token}':
+            abort(403)
+        with self._lock:
+            lines = []
+            for metric in (self.requests, self.latency, self.sql_queries, self.sql_time,
+                           self.render_time, self.response_size):
+                lines.extend(metric.render())
+        return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+    
+    def _before_request(self):
+        g._metrics = {'start': time.perf_counter(), 'sql_count': 0, 'sql_time': 0.0,
+                      'render_time': 0.0, 'render_start': None, 'statements': []}
+    
+    def _after_request(self, response):
+        stats = g.pop('_metrics', None)
+        if stats is None:
+            return response
+        elapsed = time.perf_counter() - stats['start']
+        labels = (request.endpoint or 'unmatched', request.method)
+        size = None if response.is_streamed else response.calculate_content_length()
+        with self._lock:
+            self.requests.inc(labels + (str(response.status_code),))
+            self.latency.observe(labels, elapsed)
+            self.sql_queries.observe(labels, stats['sql_count'])
+            self.sql_time.observe(labels, stats['sql_time'])
+            self.render_time.observe(labels, stats['render_time'])
+            if size is not None:
+                self.response_size.observe(labels, size)
+        if self.slow_request_ms and elapsed * 1000 >= self.slow_request_ms:
+            self._log_slow_request(labels, elapsed, stats)
+        return response
+    
+    def _log_slow_request(self, labels, elapsed, stats):
+        slowest = heapq.nlargest(self.slow_query_count, stats['statements'], key=lambda item: item[0])
+        details = ''.join(
+            f'\n  {duration * 1000:.1f}ms {" ".join(statement.split())[:200]}'
+            for duration, statement in slowest
+        )
+        self.logger.warning(
+            'Slow request %s %s %s: %.1fms total, %d queries in %.1fms, render %.1fms%s',
+            labels[1], request.path, labels[0], elapsed * 1000, stats['sql_count'],
+            stats['sql_time'] * 1000, stats['render_time'] * 1000, details
+        )
+    
+    def _before_render(self, sender, template, context, **extra):
+        stats = g.get('_metrics')
+        if stats is not None:
+            stats['render_start'] = time.perf_counter()
+    
+    def _after_render(self, sender, template, context, **extra):
+        stats = g.get('_metrics')
+        if stats is not None and stats['render_start'] is not None:
+            stats['render_time'] += time.perf_counter() - stats['render_start']
+            stats['render_start'] = None
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_start = time.perf_counter()
+    
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not has_request_context():
+            return
+        stats = g.get('_metrics')
+        start = getattr(context, '_metrics_start', None)
+        if stats is None or start is None:
+            return
+        duration = time.perf_counter() - start
+        stats['sql_count'] += 1
+        stats['sql_time'] += duration
+        if self.slow_request_ms:
+            stats['statements'].append((duration, statement))
+
+def _format_labels(names, values):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+request_metrics = RequestMetrics()
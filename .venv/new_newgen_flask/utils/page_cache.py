@@ -0,0 +1,128 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, request, session
+from flask_login import current_user
+from models.settings_cache import settings_cache
+from models.versioning import data_version
+
+class PageCache:
+    """Per-worker cache of rendered GET pages, served with strong ETags.
+    
+    Entries are keyed on endpoint, view arguments, the query arguments the
+    view declares it reads (others are ignored, so stray ones can't multiply
+    entries), theme, the shared data version and the viewer (anonymous, or
+    user id and role), so admin-only markup is never served to another auth
+    state. The cache is bounded by entry count and by total body size. Requests with
+    pending flash messages bypass the cache, and only 200 HTML responses are
+    stored. A matching ``If-None-Match`` gets a 304 straight from the cache.
+    Entries also expire after ``PAGE_CACHE_TTL`` seconds, which bounds
+    staleness where the data version file isn't shared or a bump failed.
+    """
+    
+    def __init__(self, app=None):
+        self.enabled = True
+        self.max_entries = 256
+        self.max_bytes = 16 * 1024 * 1024
+        self.ttl = 30
+        self._entries = OrderedDict()
+        self._size = 0
+        self._version = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.enabled = app.config.get('PAGE_CACHE_ENABLED', True)
+        self.max_entries = app.config.get('PAGE_CACHE_MAX_ENTRIES', 256)
+        self.max_bytes = app.config.get('PAGE_CACHE_MAX_BYTES', 16 * 1024 * 1024)
+        self.ttl = app.config.get('PAGE_CACHE_TTL', 30)
+        self.clear()
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    def cached(self, view=None, *, query_args=()):
+        """Cache a view; ``query_args`` names the request arguments it reads."""
+        if view is None:
+            return lambda func: self.cached(func, query_args=query_args)
+        
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if (not self.enabled or self.ttl <= 0 or request.method != 'GET'
+                    or session.get('_flashes')):
+                return view(*args, **kwargs)
+            
+            authenticated = current_user.is_authenticated
+            key = self._make_key(authenticated, query_args)
+            entry = self._get(key)
+            if entry is None:
+                response = current_app.make_response(view(*args, **kwargs))
+                if (response.status_code != 200 or response.mimetype != 'text/html'
+                        or session.get('_flashes')):
+                    return response
+                body = response.get_data()
+                entry = (body, hashlib.sha256(body).hexdigest()[:32], response.mimetype,
+                         time.monotonic() + self.ttl)
+                self._set(key, entry)
+            return self._respond(entry, authenticated)
+        return wrapper
+    
+    def _make_key(self, authenticated, query_args):
+        if authenticated:
+            viewer = ('user', current_user.get_id(), getattr(current_user, 'role', None))
+        else:
+            viewer = ('anonymous',)
+        return (
+            data_version.read(),
+            request.endpoint,
+            tuple(sorted((request.view_args or {}).items())),
+            tuple((name, tuple(request.args.getlist(name))) for name in query_args),
+            settings_cache.get('theme.mode', 'dark'),
+            viewer
+        )
+    
+    def _get(self, key):
+        with self._lock:
+            if key[0] != self._version:
+                # Data changed since the entries were rendered; drop them all
+                self._entries.clear()
+                self._size = 0
+                self._version = key[0]
+                return None
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() >= entry[3]:
+                del self._entries[key]
+                self._size -= len(entry[0])
+                return None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def _set(self, key, entry):
+        with self._lock:
+            if key[0] != self._version or len(entry[0]) > self.max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[0])
+            self._entries[key] = entry
+            self._size += len(entry[0])
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted[0])
+    
+    def _respond(self, entry, authenticated):
+        body, etag, mimetype, _ = entry
+        response = current_app.response_class(body, mimetype=mimetype)
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        if authenticated:
+            response.cache_control.private = True
+        return response.make_conditional(request)
+
+page_cache = PageCache()
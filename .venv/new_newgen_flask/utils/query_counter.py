@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+from models.database import db
+
+class QueryCounter:
+    """Collects the SQL statements executed on the app's engine."""
+    
+    def __init__(self):
+        self.statements = []
+    
+    @property
+    def count(self):
+        return len(self.statements)
+    
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+@contextmanager
+def count_queries(engine=None):
+    """Count statements executed inside the block. Needs an app context.
+    
+        with count_queries() as counter:
+            client.get('/team-members')
+        print(counter.count)
+    """
+    engine = engine or db.engine
+    counter = QueryCounter()
+    event.listen(engine, 'before_cursor_execute', counter._record)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, 'before_cursor_execute', counter._record)
+
+@contextmanager
+def assert_max_queries(limit, engine=None):
+    """Fail with AssertionError if the block runs more than ``limit`` queries.
+    
+    Use it around a request in tests to keep N+1 patterns from creeping
+    back into templates, e.g. ``with assert_max_queries(6): client.get(...)``.
+    """
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count > limit:
+        listing = '\n'.join(f'  {i}. {sql}' for i, sql in enumerate(counter.statements, 1))
+        raise AssertionError(
+            f'Expected at most {limit} queries, {counter.count} were executed:\n{listing}'
+        )